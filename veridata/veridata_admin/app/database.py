@@ -36,7 +36,13 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
-engine = create_async_engine(settings.database_url_resolved, echo=False, future=True)
+engine = create_async_engine(
+    settings.database_url_resolved,
+    echo=False,
+    future=True,
+    # Our queries are small OLTP lookups; JIT compilation only adds latency to them
+    connect_args={"server_settings": {"jit": "off"}, "statement_cache_size": 1024},
+)
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
 
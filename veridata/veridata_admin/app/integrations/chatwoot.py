@@ -11,6 +11,22 @@ class ChatwootClient:
         self.base_url = base_url.rstrip("/")
         self.account_id = account_id
         self.headers = {"api_access_token": access_token}
+        # One connection pool per client instance, reused across calls
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=50),
+            timeout=10.0,
+        )
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
 
     async def get_conversations(self, status: str = "open") -> List[Dict[str, Any]]:
         """Fetch conversations by status.
@@ -18,15 +34,14 @@ class ChatwootClient:
         Args:
             status: 'open', 'resolved', 'pending', or 'all'
         """
-        url = f"{self.base_url}/api/v1/accounts/{self.account_id}/conversations"
+        url = f"/api/v1/accounts/{self.account_id}/conversations"
         params = {"status": status, "sort_by": "last_activity_at", "sort_order": "desc"}
 
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(url, headers=self.headers, params=params)
-                resp.raise_for_status()
-                data = resp.json()
-                return data.get("data", {}).get("payload", [])
+            resp = await self._client.get(url, params=params)
+            resp.raise_for_status()
+            data = resp.json()
+            return data.get("data", {}).get("payload", [])
         except Exception as e:
             logger.error(f"Failed to fetch conversations from Chatwoot: {e}")
             return []
@@ -34,15 +49,14 @@ class ChatwootClient:
     async def toggle_status(self, conversation_id: int, status: str):
         """Update conversation status (e.g., to 'resolved').
         """
-        url = f"{self.base_url}/api/v1/accounts/{self.account_id}/conversations/{conversation_id}/toggle_status"
+        url = f"/api/v1/accounts/{self.account_id}/conversations/{conversation_id}/toggle_status"
         payload = {"status": status}
 
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(url, headers=self.headers, json=payload)
-                resp.raise_for_status()
-                logger.info(f"Successfully changed status of conversation {conversation_id} to {status}")
-                return resp.json()
+            resp = await self._client.post(url, json=payload)
+            resp.raise_for_status()
+            logger.info(f"Successfully changed status of conversation {conversation_id} to {status}")
+            return resp.json()
         except Exception as e:
             logger.error(f"Failed to toggle status for conversation {conversation_id}: {e}")
             raise e
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime, timezone
 
@@ -39,47 +40,50 @@ async def run_auto_resolve_job(session: AsyncSession, config: SyncConfig):
         log_error(logger, f"Invalid Chatwoot credentials in ServiceConfig {service_config.id}")
         return
 
-    client = ChatwootClient(base_url, str(account_id), access_token)
-
-    # Fetch OPEN and PENDING conversations
-    log_external_call(logger, "Chatwoot", "Fetching open/pending conversations")
-    conversations_open = await client.get_conversations(status="open")
-    conversations_pending = await client.get_conversations(status="pending")
+    async with ChatwootClient(base_url, str(account_id), access_token) as client:
+        # Fetch OPEN and PENDING conversations
+        log_external_call(logger, "Chatwoot", "Fetching open/pending conversations")
+        # Independent requests on the same pooled client: issue them together
+        conversations_open, conversations_pending = await asyncio.gather(
+            client.get_conversations(status="open"),
+            client.get_conversations(status="pending"),
+        )
 
-    conversations = conversations_open + conversations_pending
+        conversations = conversations_open + conversations_pending
 
-    now = datetime.now(timezone.utc).timestamp()  # Current unix timestamp
+        now = datetime.now(timezone.utc).timestamp()  # Current unix timestamp
 
-    # Use inactivity_threshold_minutes if set, otherwise fallback to 30 mins
-    inactivity_mins = config.inactivity_threshold_minutes if config.inactivity_threshold_minutes is not None else 30
-    threshold_seconds = inactivity_mins * 60
+        # Use inactivity_threshold_minutes if set, otherwise fallback to 30 mins
+        inactivity_mins = config.inactivity_threshold_minutes if config.inactivity_threshold_minutes is not None else 30
+        threshold_seconds = inactivity_mins * 60
 
-    resolve_count = 0
+        resolve_count = 0
 
-    for conv in conversations:
-        # last_activity_at is a unix timestamp in Chatwoot (usually)
-        # Verify format: "last_activity_at": 1709230232
-        last_activity = conv.get("last_activity_at")
+        for conv in conversations:
+            # last_activity_at is a unix timestamp in Chatwoot (usually)
+            # Verify format: "last_activity_at": 1709230232
+            last_activity = conv.get("last_activity_at")
 
-        if not last_activity:
-            continue
+            if not last_activity:
+                continue
 
-        try:
-            last_activity_ts = float(last_activity)
+            try:
+                last_activity_ts = float(last_activity)
 
-            # Check Inactivity
-            if (now - last_activity_ts) > threshold_seconds:
-                conv_id = conv.get("id")
-                log_job(
-                    logger,
-                    f"Conversation {conv_id} inactive for {(now - last_activity_ts) / 60:.1f} mins (Threshold: {inactivity_mins}m). Resolving...",
-                )
+                # Check Inactivity
+                if (now - last_activity_ts) > threshold_seconds:
+                    conv_id = conv.get("id")
+                    log_job(
+                        logger,
+                        f"Conversation {conv_id} inactive for {(now - last_activity_ts) / 60:.1f} mins "
+                        f"(Threshold: {inactivity_mins}m). Resolving...",
+                    )
 
-                await client.toggle_status(conv_id, "resolved")
-                resolve_count += 1
+                    await client.toggle_status(conv_id, "resolved")
+                    resolve_count += 1
 
-        except Exception as e:
-            log_error(logger, f"Error processing conversation {conv.get('id')}: {e}")
+            except Exception as e:
+                log_error(logger, f"Error processing conversation {conv.get('id')}: {e}")
 
     if resolve_count > 0:
         log_success(logger, f"Auto-Resolve Job Complete. Resolved {resolve_count} conversations.")
@@ -8,6 +8,7 @@ from fastapi.responses import FileResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from sqladmin import Admin, BaseView, expose
 from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 from app.admin import (
@@ -21,7 +22,7 @@ from app.admin import (
 )
 from app.core.logging import log_error, log_job, setup_logging
 from app.database import engine, get_session
-from app.models import Client, SyncConfig
+from app.models import SyncConfig
 
 
 
@@ -38,25 +39,25 @@ async def sync_worker_loop():
     while True:
         try:
             async for session in get_session():
-                query = select(SyncConfig).where(SyncConfig.is_active == True)
+                # Load each config's client in the same query (avoids one SELECT per config)
+                query = (
+                    select(SyncConfig)
+                    .options(joinedload(SyncConfig.client))
+                    .where(SyncConfig.is_active == True)
+                )
                 result = await session.execute(query)
                 configs = result.scalars().all()
 
                 for config in configs:
-                    # Fetch client name for logging
-                    client = await session.get(Client, config.client_id)
+                    client = config.client
                     client_name = client.name if client else f"ID {config.client_id}"
 
                     log_job(logger, f"Checking job for [{client_name}] on [{config.platform}]")
 
                     # Smart Scheduler Logic
                     should_run = False
-                    now = datetime.now(timezone.utc).replace(
-                        tzinfo=None
-                    )  # Ensure naive/aware consistency based on DB config
-                    # OR just standard datetime.now() if using naive. SQLModel usually uses naive by default for SQLite/PG unless configured.
-                    # Safety: Use naive UTC for simplicity if DB is naive
-                    now = datetime.utcnow()
+                    # last_run_at is stored as naive UTC
+                    now = datetime.now(timezone.utc).replace(tzinfo=None)
 
                     if not config.last_run_at:
                         should_run = True
@@ -116,6 +117,37 @@ async def lifespan(app: FastAPI):
             await conn.execute(
                 text("ALTER TABLE sync_configs ADD COLUMN IF NOT EXISTS inactivity_threshold_minutes INTEGER")
             )
+
+            # Indexes for the bot's per-tenant lookups (create_all skips existing tables)
+            await conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_bot_sessions_client_ext "
+                    "ON bot_sessions (client_id, external_session_id)"
+                )
+            )
+            await conn.execute(text("DROP INDEX IF EXISTS ix_bot_sessions_external_session_id"))
+            await conn.execute(
+                text("CREATE INDEX IF NOT EXISTS ix_service_configs_client_id ON service_configs (client_id)")
+            )
+            await conn.execute(
+                text("CREATE INDEX IF NOT EXISTS ix_subscriptions_client_id ON subscriptions (client_id)")
+            )
+
+            # json -> jsonb (only touches columns still typed json, so restarts don't rewrite tables)
+            for table, column in (
+                ("sync_configs", "config_json"),
+                ("service_configs", "config"),
+                ("global_configs", "config"),
+            ):
+                await conn.execute(
+                    text(
+                        f"DO $$ BEGIN "
+                        f"IF (SELECT data_type FROM information_schema.columns "
+                        f"WHERE table_name = '{table}' AND column_name = '{column}') = 'json' THEN "
+                        f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb; "
+                        f"END IF; END $$"
+                    )
+                )
         except Exception as e:
             logger.warning(f"Migration check failed (safe to ignore if column exists): {e}")
 
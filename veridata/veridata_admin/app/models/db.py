@@ -2,8 +2,8 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import JSON, TIMESTAMP, Boolean, ForeignKey, Integer, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import TIMESTAMP, Boolean, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -35,7 +35,7 @@ class SyncConfig(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     client_id: Mapped[int] = mapped_column(ForeignKey("clients.id"))
     platform: Mapped[str] = mapped_column(String, index=True)
-    config_json: Mapped[dict] = mapped_column(JSON, default={})
+    config_json: Mapped[dict] = mapped_column(JSONB, default={})
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     frequency_minutes: Mapped[int] = mapped_column(Integer, default=60)
     inactivity_threshold_minutes: Mapped[Optional[int]] = mapped_column(Integer, default=30)
@@ -51,8 +51,8 @@ class ServiceConfig(Base):
     __tablename__ = "service_configs"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    client_id: Mapped[int] = mapped_column(ForeignKey("clients.id"))
-    config: Mapped[dict] = mapped_column(JSON, default={})
+    client_id: Mapped[int] = mapped_column(ForeignKey("clients.id"), index=True)
+    config: Mapped[dict] = mapped_column(JSONB, default={})
 
     client: Mapped["Client"] = relationship(back_populates="service_configs")
 
@@ -64,7 +64,7 @@ class Subscription(Base):
     __tablename__ = "subscriptions"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    client_id: Mapped[int] = mapped_column(ForeignKey("clients.id"))
+    client_id: Mapped[int] = mapped_column(ForeignKey("clients.id"), index=True)
     quota_limit: Mapped[int] = mapped_column(Integer, default=1000)
     usage_count: Mapped[int] = mapped_column(Integer, default=0)
     start_date: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True))
@@ -78,10 +78,12 @@ class Subscription(Base):
 
 class BotSession(Base):
     __tablename__ = "bot_sessions"
+    # Session lookups always filter by tenant + Chatwoot conversation id
+    __table_args__ = (Index("ix_bot_sessions_client_ext", "client_id", "external_session_id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     client_id: Mapped[int] = mapped_column(ForeignKey("clients.id"))
-    external_session_id: Mapped[str] = mapped_column(String, index=True)
+    external_session_id: Mapped[str] = mapped_column(String)
     rag_session_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
 
     client: Mapped["Client"] = relationship(back_populates="bot_sessions")
@@ -94,7 +96,7 @@ class GlobalConfig(Base):
     __tablename__ = "global_configs"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    config: Mapped[dict] = mapped_column(JSON, default={})
+    config: Mapped[dict] = mapped_column(JSONB, default={})
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now()
     )
@@ -1,14 +1,37 @@
+import asyncio
 import logging
-import json
 import uuid
-from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-from app.core.config import settings
+from functools import cache
+from langchain_core.prompts import ChatPromptTemplate
+from app.core.llm_config import get_chat_model, invoke_llm
+from app.dtos.summary import ConversationSummary
 from app.agent.prompts import SUMMARY_PROMPT_TEMPLATE
 from app.integrations.rag import RagClient
 
 logger = logging.getLogger(__name__)
 
+SUMMARY_TIMEOUT_SECONDS = 30.0
+
+# Parsed once at import; each call only fills in the two variables
+_SUMMARY_PROMPT = ChatPromptTemplate.from_messages(
+    [("system", SUMMARY_PROMPT_TEMPLATE), ("human", "Analyze the conversation now.")]
+)
+
+
+@cache
+def _get_summary_chain(model_name: str):
+    # Gemini JSON mode constrained to the ConversationSummary schema; include_raw keeps
+    # the text around so an unparseable reply still falls back to a plain summary.
+    return _SUMMARY_PROMPT | get_chat_model(model_name).with_structured_output(
+        ConversationSummary, method="json_schema", include_raw=True
+    )
+
+
+# Summaries currently being generated, keyed by (session, language). Chatwoot can fire
+# several "resolved" webhooks for one conversation in quick succession; they share one run.
+_inflight: dict[tuple[uuid.UUID, str | None], asyncio.Task] = {}
+
+
 async def summarize_start_conversation(
     session_id: uuid.UUID,
     rag_client: RagClient,
@@ -16,7 +39,25 @@ async def summarize_start_conversation(
 ) -> dict:
     """
     Fetches chat history from RAG and generates a structured summary using Gemini.
+    Concurrent calls for the same session are coalesced into a single LLM call.
     """
+    key = (session_id, language_instruction)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_summarize_conversation(session_id, rag_client, language_instruction))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    # shield: one caller being cancelled must not cancel the shared run.
+    # Copy: callers add their own keys to the returned dict.
+    return dict(await asyncio.shield(task))
+
+
+async def _summarize_conversation(
+    session_id: uuid.UUID,
+    rag_client: RagClient,
+    language_instruction: str = None
+) -> dict:
     try:
         # 1. Fetch History
         history_data = await rag_client.get_history(session_id)
@@ -24,56 +65,41 @@ async def summarize_start_conversation(
             logger.warning("No history found for summarization.")
             return {}
 
-        # Format history for prompt
-        history_str = ""
-        first_msg_time = None
-
-        for msg in history_data:
-            role = msg.get("role", "unknown")
-            content = msg.get("content", "")
-            timestamp = msg.get("timestamp") # Assuming RAG returns this?
-
-            # Capture start time if available in metadata
-            if not first_msg_time and timestamp:
-                first_msg_time = timestamp
+        # Format history for prompt (one join instead of re-copying the string per message)
+        history_str = "".join(
+            f"{msg.get('role', 'unknown').upper()}: {msg.get('content', '')}\n" for msg in history_data
+        )
 
-            history_str += f"{role.upper()}: {content}\n"
+        # Capture start time if available in metadata
+        first_msg_time = next((msg["timestamp"] for msg in history_data if msg.get("timestamp")), None)
 
-        # 2. Prepare Prompt
+        # 2. Prepare Prompt Variables
         lang_instr = f"IMPORTANT: Detected Language Override: {language_instruction}" if language_instruction else ""
 
-        prompt = SUMMARY_PROMPT_TEMPLATE.format(
-            history_str=history_str,
-            language_instruction=lang_instr
-        )
+        # 3. Call LLM (structured output: no fences to strip, no manual json parsing)
+        chain = _get_summary_chain("gemini-2.0-flash")
 
-        # 3. Call LLM
-        model = ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash",
-            temperature=0,
-            google_api_key=settings.google_api_key,
+        result = await invoke_llm(
+            chain,
+            {"history_str": history_str, "language_instruction": lang_instr},
+            timeout=SUMMARY_TIMEOUT_SECONDS,
         )
+        summary = result["parsed"]
 
-        messages = [
-            SystemMessage(content=prompt),
-            HumanMessage(content="Analyze the conversation now.")
-        ]
-
-        response = await model.ainvoke(messages)
-        content = response.content.replace("```json", "").replace("```", "").strip()
-
-        # 4. Parse JSON
-        try:
-            summary_data = json.loads(content)
-            # Inject start time availability check
-            if first_msg_time:
-                 summary_data["session_start_time"] = first_msg_time
-            return summary_data
-
-        except json.JSONDecodeError:
-            logger.error(f"Failed to parse summary JSON: {content}")
+        if summary is None:
+            content = result["raw"].content
+            logger.error(f"Failed to parse summary JSON: {result['parsing_error']} | {content}")
             return {"ai_summary": content} # Fallback
 
+        summary_data = summary.model_dump()
+        # Inject start time availability check
+        if first_msg_time:
+             summary_data["session_start_time"] = first_msg_time
+        return summary_data
+
+    except TimeoutError:
+        logger.error(f"Summarization timed out after {SUMMARY_TIMEOUT_SECONDS}s")
+        return {}
     except Exception as e:
         logger.error(f"Summarization failed: {e}")
         return {}
@@ -1,12 +1,16 @@
 from langchain_core.tools import tool
 from langchain_core.runnables import RunnableConfig
-from app.integrations.rag import RagClient
+from app.integrations.rag import get_rag_client
 from app.integrations.sheets import fetch_google_sheet_data
 import logging
+import re
 import uuid
 
 logger = logging.getLogger(__name__)
 
+# Canonical UUID text form; cheaper than building uuid.UUID inside try/except per call
+_UUID_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z", re.I)
+
 @tool
 async def search_knowledge_base(query: str, config: RunnableConfig) -> str:
     """
@@ -35,15 +39,17 @@ async def search_knowledge_base(query: str, config: RunnableConfig) -> str:
         # But RAG `query` expects session_id for history context if we want it.
         # For ReAct, the Agent holds the history in 'messages'.
         # RAG might benefit from knowing the session ID for logging/persistence side-effects.
-        rag_session_id_str = configuration.get("rag_session_id")
-        rag_session_id = None
-        if rag_session_id_str:
-            try:
-                rag_session_id = uuid.UUID(rag_session_id_str)
-            except:
-                pass
-
-        client = RagClient(base_url=base_url, api_key=api_key, tenant_id=tenant_id)
+        raw_session_id = configuration.get("rag_session_id")
+        if isinstance(raw_session_id, uuid.UUID):
+            # Already a parsed UUID (from the BotSession row): nothing to validate
+            rag_session_id = raw_session_id
+        elif isinstance(raw_session_id, str) and _UUID_RE.match(raw_session_id):
+            # RagClient only needs the string form for the request payload
+            rag_session_id = raw_session_id
+        else:
+            rag_session_id = None
+
+        client = get_rag_client(base_url, api_key, tenant_id)
 
         # 3. Call RAG
         # We simplify the call. Agent handles history, so RAG might not need full context history
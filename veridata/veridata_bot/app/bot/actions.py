@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import time
+from typing import NamedTuple
 
 import httpx
 from fastapi import HTTPException
@@ -8,9 +11,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.agent.summarizer import summarize_start_conversation
 from app.core.logging import log_db, log_error, log_external_call, log_skip, log_start, log_success
 from app.integrations.chatwoot import ChatwootClient
-from app.integrations.crm.espocrm import EspoClient
-from app.integrations.crm.hubspot import HubSpotClient
-from app.integrations.rag import RagClient
+from app.integrations.crm.espocrm import get_espo_client
+from app.integrations.crm.hubspot import get_hubspot_client
+from app.integrations.rag import get_rag_client
 from app.models import BotSession, Client, ServiceConfig, Subscription
 
 import datetime
@@ -23,26 +26,49 @@ logger = logging.getLogger(__name__)
 # ACTION: GET CLIENT & CONFIG
 # Helper to fetch the Tenant and its Secrets (API Keys) from DB
 # ==================================================================================
-async def get_client_and_config(client_slug: str, db: AsyncSession):
-    query = select(Client).where(Client.slug == client_slug, Client.is_active == True)
+class Tenant(NamedTuple):
+    """Plain snapshot of a Client row, safe to share across requests and sessions."""
+    id: int
+    slug: str
+
+
+# Tenant + ServiceConfig per slug. Every webhook needs them and they change rarely;
+# edits made in the admin panel take effect within the TTL. Only plain values are cached:
+# a mapped Client would stay tied to the session that loaded it and be expired by its rollback.
+_TENANT_TTL_SECONDS = 30.0
+_tenant_cache: dict[str, tuple[float, Tenant, dict]] = {}
+
+
+async def get_client_and_config(client_slug: str, db: AsyncSession) -> tuple[Tenant, dict]:
+    cached = _tenant_cache.get(client_slug)
+    if cached and time.monotonic() - cached[0] < _TENANT_TTL_SECONDS:
+        # Copy: a request must not change the dict other requests read
+        return cached[1], dict(cached[2])
+
+    # One round-trip for the tenant and its config (outer join: a client may have no config yet)
+    query = (
+        select(Client.id, Client.slug, ServiceConfig.config)
+        .outerjoin(ServiceConfig, ServiceConfig.client_id == Client.id)
+        .where(Client.slug == client_slug, Client.is_active == True)
+        .limit(1)
+    )
     result = await db.execute(query)
-    client = result.scalars().first()
+    row = result.first()
 
-    if not client:
+    if not row:
         log_error(logger, f"Client not found or inactive: {client_slug}")
         raise HTTPException(status_code=404, detail="Client not found or inactive")
 
-    cfg_query = select(ServiceConfig).where(ServiceConfig.client_id == client.id)
-    cfg_result = await db.execute(cfg_query)
-    cfg_record = cfg_result.scalars().first()
-    configs = cfg_record.config if cfg_record else {}
+    tenant = Tenant(row.id, row.slug)
+    configs = row.config or {}
 
-    return client, configs
+    _tenant_cache[client_slug] = (time.monotonic(), tenant, configs)
+    return tenant, dict(configs)
 
 
 # ==================================================================================
 # ACTION: LOAD CRM CLIENTS
-# Creates instances of HubSpot/EspoCRM clients based on config.
+# Looks up the (cached) HubSpot/EspoCRM clients for this config.
 # returns a list of active clients.
 # ==================================================================================
 def get_crm_integrations(configs):
@@ -50,13 +76,13 @@ def get_crm_integrations(configs):
 
     espo_conf = configs.get("espocrm")
     if espo_conf:
-        integrations.append(EspoClient(base_url=espo_conf["base_url"], api_key=espo_conf["api_key"]))
+        integrations.append(get_espo_client(espo_conf["base_url"], espo_conf["api_key"]))
 
     hub_conf = configs.get("hubspot")
     if hub_conf:
         token = hub_conf.get("access_token") or hub_conf.get("api_key")
         if token:
-            integrations.append(HubSpotClient(access_token=token))
+            integrations.append(get_hubspot_client(token))
 
     return integrations
 
@@ -69,8 +95,7 @@ async def check_subscription_quota(client_id, client_slug, db: AsyncSession):
     sub_query = select(Subscription).where(
         Subscription.client_id == client_id, Subscription.usage_count < Subscription.quota_limit
     )
-    result = await db.execute(sub_query)
-    subscription = result.scalars().first()
+    subscription = await db.scalar(sub_query)
 
     if not subscription:
         log_error(logger, f"Subscription limit reached for {client_slug}")
@@ -81,7 +106,7 @@ async def check_subscription_quota(client_id, client_slug, db: AsyncSession):
 
 # ==================================================================================
 # ACTION: EXECUTE CRM ACTION
-# Generic wrapper to run a function on ALL connected CRMs sequentially.
+# Generic wrapper to run a function on ALL connected CRMs concurrently.
 # E.g. "Save Lead" -> saves to both HubSpot and Espo if configured.
 # ==================================================================================
 async def execute_crm_action(crms, action_desc, action_func):
@@ -90,13 +115,14 @@ async def execute_crm_action(crms, action_desc, action_func):
         return
 
     log_external_call(logger, "CRM", f"Syncing {action_desc} to {len(crms)} integrations")
-    for crm in crms:
+    # Different hosts, no shared state: one failing CRM must not block or cancel the others
+    results = await asyncio.gather(*(action_func(crm) for crm in crms), return_exceptions=True)
+    for crm, result in zip(crms, results):
         platform_name = crm.__class__.__name__.replace("Client", "")
-        try:
-            await action_func(crm)
+        if isinstance(result, Exception):
+            log_error(logger, f"CRM Sync failed for {platform_name}: {result}")
+        else:
             log_success(logger, f"{action_desc} synced: {platform_name}")
-        except Exception as e:
-            log_error(logger, f"CRM Sync failed for {platform_name}: {e}")
 
 
 
@@ -195,10 +221,8 @@ async def handle_conversation_resolution(client, configs, conversation_data, sen
         rag_config = configs.get("rag")
         if rag_config:
             try:
-                rag_client = RagClient(
-                    base_url=rag_config["base_url"],
-                    api_key=rag_config.get("api_key", ""),
-                    tenant_id=rag_config["tenant_id"],
+                rag_client = get_rag_client(
+                    rag_config["base_url"], rag_config.get("api_key", ""), rag_config["tenant_id"]
                 )
 
                 # New Local Summarization Flow
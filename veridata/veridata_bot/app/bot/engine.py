@@ -1,4 +1,6 @@
 import logging
+from collections import OrderedDict
+
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.dtos.webhook import ChatwootEvent, IntegrationEvent
@@ -12,9 +14,32 @@ from app.bot.actions import (
     handle_conversation_resolution,
 )
 from app.core.logging import log_error, log_skip, log_start, log_success
+from app.services.agent_service import run_agent_pipeline
+from app.services.session_service import get_or_create_bot_session
 
 logger = logging.getLogger(__name__)
 
+# Chatwoot delivers webhooks at-least-once; remember recent messages so a re-delivery
+# does not run the agent (and reply) twice. Keyed by (client_slug, message_id): ids are
+# per Chatwoot installation and one process serves every tenant.
+_seen_messages: OrderedDict[tuple[str, int], None] = OrderedDict()
+_SEEN_MAX = 10_000
+
+
+def _is_duplicate_message(key: tuple[str, int]) -> bool:
+    return key in _seen_messages
+
+
+def _mark_message_seen(key: tuple[str, int]) -> bool:
+    """Records the message as accepted. Returns False if a concurrent delivery got there first."""
+    if key in _seen_messages:
+        return False
+
+    _seen_messages[key] = None
+    if len(_seen_messages) > _SEEN_MAX:
+        _seen_messages.popitem(last=False)
+    return True
+
 
 async def process_integration_event(client_slug: str, payload_dict: dict, db: AsyncSession):
     log_start(logger, f"Processing Integration Event for {client_slug}")
@@ -114,6 +139,13 @@ async def process_bot_event(client_slug: str, payload_dict: dict, db: AsyncSessi
         log_error(logger, f"Invalid Bot Payload: {e}")
         return {"status": "invalid_payload"}
 
+    # Cheap early exit for re-deliveries; the id is only recorded once the event is accepted
+    # below, so a delivery that fails on config/quota lookup can still be retried.
+    dedup_key = (client_slug, event.id) if event.is_valid_bot_command and event.id is not None else None
+    if dedup_key and _is_duplicate_message(dedup_key):
+        log_skip(logger, f"Duplicate delivery of message {event.id} in conversation {event.conversation_id}")
+        return {"status": "duplicate"}
+
     # ==================================================================================
     # STEP 2: LOAD CLIENT & CONFIGURATION
     # ==================================================================================
@@ -145,6 +177,12 @@ async def process_bot_event(client_slug: str, payload_dict: dict, db: AsyncSessi
             return {"status": f"ignored_{event.conversation.status}"}
         return {"status": "ignored_generic"}
 
+    # Accepted for processing. Check-and-record with no await in between: a concurrent
+    # re-delivery may have been accepted while this one awaited the config/quota lookups.
+    if dedup_key and not _mark_message_seen(dedup_key):
+        log_skip(logger, f"Duplicate delivery of message {event.id} in conversation {event.conversation_id}")
+        return {"status": "duplicate"}
+
     # Basic Message Data
     conversation_id = event.conversation_id
     user_query = event.content
@@ -166,14 +204,11 @@ async def process_bot_event(client_slug: str, payload_dict: dict, db: AsyncSessi
         # ==================================================================================
         # STEP 6: SESSION MANAGEMENT (Delegated to Service)
         # ==================================================================================
-        from app.services.session_service import get_or_create_bot_session
         session = await get_or_create_bot_session(db, client.id, conversation_id)
 
         # ==================================================================================
         # STEP 7 & 8: EXECUTE AGENT (Delegated to Service)
         # ==================================================================================
-        from app.services.agent_service import run_agent_pipeline
-
         answer, requires_human = await run_agent_pipeline(
             db=db,
             session=session,
@@ -15,6 +15,9 @@ class Settings(BaseSettings):
     rag_service_url: str = "http://veridata.rag:8000"
     rag_api_key: str = ""
     google_api_key: str = ""
+    gemini_model: str = "gemini-2.0-flash"
+    llm_max_concurrency: int = 32
+    sheet_cache_ttl: float = 60.0
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -0,0 +1,25 @@
+import httpx
+
+# Shared outbound HTTP client.
+# One keep-alive pool for the whole process, so repeated calls to the same
+# host (Chatwoot, RAG, CRMs) skip the TCP/TLS handshake.
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Returns the process-wide AsyncClient, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(10.0),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Closes the shared client. Called once on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
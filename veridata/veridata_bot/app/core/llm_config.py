@@ -1,13 +1,24 @@
+import asyncio
+from functools import cache
+from typing import Any, AsyncIterator
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from langchain_google_genai import ChatGoogleGenerativeAI
+from app.core.config import settings
 from app.core.db import async_session_maker
 from app.models.config import GlobalConfig
 import logging
 
 logger = logging.getLogger(__name__)
 
-async def get_llm_config() -> dict:
+# Per-process cap on in-flight Gemini requests. Bursts queue here instead of piling
+# onto the API and coming back as rate-limit retries.
+llm_semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+
+async def get_llm_config(db: AsyncSession | None = None) -> dict:
     """
     Fetches the full LLM configuration from GlobalConfig.
+    Reuses the caller's session when given one instead of checking out another connection.
     Returns a dict with:
       - model_name: str (default: "gemini-2.0-flash")
       - use_hyde: bool (default: False)
@@ -20,25 +31,65 @@ async def get_llm_config() -> dict:
     }
 
     try:
-        async with async_session_maker() as session:
-            stmt = select(GlobalConfig).limit(1)
-            result = await session.execute(stmt)
-            config_record = result.scalars().first()
+        stmt = select(GlobalConfig).limit(1)
+        if db is not None:
+            config_record = await db.scalar(stmt)
+        else:
+            async with async_session_maker() as session:
+                config_record = await session.scalar(stmt)
 
-            if config_record and config_record.config:
-                llm_cfg = config_record.config.get("llm_config", {})
+        if config_record and config_record.config:
+            llm_cfg = config_record.config.get("llm_config", {})
 
-                # Extract flags
-                defaults["use_hyde"] = llm_cfg.get("use_hyde", False)
-                defaults["use_rerank"] = llm_cfg.get("use_rerank", False)
+            # Extract flags
+            defaults["use_hyde"] = llm_cfg.get("use_hyde", False)
+            defaults["use_rerank"] = llm_cfg.get("use_rerank", False)
 
-                # Extract model name
-                # JSON Path: llm_config -> steps -> complex_reasoning -> model
-                model_path = llm_cfg.get("steps", {}).get("complex_reasoning", {}).get("model")
-                if model_path:
-                    defaults["model_name"] = model_path.replace("models/", "")
+            # Extract model name
+            # JSON Path: llm_config -> steps -> complex_reasoning -> model
+            model_path = llm_cfg.get("steps", {}).get("complex_reasoning", {}).get("model")
+            if model_path:
+                defaults["model_name"] = model_path.replace("models/", "")
 
     except Exception as e:
         logger.error(f"Failed to fetch GlobalConfig: {e}")
 
     return defaults
+
+
+class _BoundedChatGoogleGenerativeAI(ChatGoogleGenerativeAI):
+    """
+    Takes a llm_semaphore slot per model request only, so an agent run does not hold
+    one while its tools wait on RAG or sheet downloads.
+    """
+
+    async def _agenerate(self, *args: Any, **kwargs: Any):
+        async with llm_semaphore:
+            return await super()._agenerate(*args, **kwargs)
+
+    async def _astream(self, *args: Any, **kwargs: Any) -> AsyncIterator:
+        async with llm_semaphore:
+            async for chunk in super()._astream(*args, **kwargs):
+                yield chunk
+
+
+@cache
+def get_chat_model(model_name: str) -> ChatGoogleGenerativeAI:
+    """
+    Returns the shared chat model for this model name, built once per process.
+    Every request it makes counts against llm_semaphore.
+    """
+    return _BoundedChatGoogleGenerativeAI(
+        model=model_name,
+        temperature=0,
+        google_api_key=settings.google_api_key,
+    )
+
+
+async def invoke_llm(runnable, input: Any, timeout: float, config: dict | None = None) -> Any:
+    """
+    Runs runnable.ainvoke with an overall deadline that also covers time spent queued
+    on llm_semaphore. Raises TimeoutError if it takes longer than timeout seconds.
+    """
+    async with asyncio.timeout(timeout):
+        return await runnable.ainvoke(input, config=config)
@@ -1,6 +1,8 @@
+import atexit
 import json
 import logging
 import logging.config
+import logging.handlers
 import sys
 
 # Emojis for Visual Grepping
@@ -29,8 +31,23 @@ class PrettyJSONFormatter(logging.Formatter):
         return super().format(record)
 
 
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues the record untouched.
+
+    The stock handler formats the message on the calling thread; here formatting
+    (including PrettyJSONFormatter's dict dumps) and the stdout write both happen
+    on the listener thread, so coroutines only pay for a queue put.
+    """
+
+    def prepare(self, record):
+        return record
+
+
 def setup_logging(log_level=logging.INFO):
     """Configures logging with Console handler only (Docker/Dozzle friendly).
+
+    Records go through a queue and are written by a background listener thread,
+    keeping stdout I/O off the event loop.
     """
     logging_config = {
         "version": 1,
@@ -45,17 +62,27 @@ def setup_logging(log_level=logging.INFO):
                 "stream": sys.stdout,
                 "formatter": "pretty",
                 "level": log_level,
-            }
+            },
+            "queue": {
+                "class": "app.core.logging.DeferredQueueHandler",
+                "handlers": ["console"],
+                "respect_handler_level": True,
+            },
         },
-        "root": {"handlers": ["console"], "level": log_level},
+        "root": {"handlers": ["queue"], "level": log_level},
         "loggers": {
-            "uvicorn": {"handlers": ["console"], "level": "INFO", "propagate": False},
-            "sqlalchemy.engine": {"handlers": ["console"], "level": "WARNING", "propagate": False},
+            "uvicorn": {"handlers": ["queue"], "level": "INFO", "propagate": False},
+            "sqlalchemy.engine": {"handlers": ["queue"], "level": "WARNING", "propagate": False},
         },
     }
 
     logging.config.dictConfig(logging_config)
 
+    listener = logging.getHandlerByName("queue").listener
+    listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(listener.stop)
+
 
 # Helper functions for standardized logging
 def log_payload(logger, payload, msg="Payload Received"):
@@ -0,0 +1,24 @@
+from typing import Optional
+from pydantic import BaseModel
+
+# --- Conversation Summary (LLM structured output) ---
+# Field names match SUMMARY_PROMPT_TEMPLATE and what ConversationFormatter reads.
+
+
+class ContactInfo(BaseModel):
+    name: Optional[str] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    address: Optional[str] = None
+    industry: Optional[str] = None
+
+
+class ConversationSummary(BaseModel):
+    purchase_intent: str
+    urgency_level: str
+    sentiment_score: str
+    detected_budget: Optional[str] = None
+    detected_language: str
+    ai_summary: str
+    contact_info: ContactInfo
+    client_description: str
@@ -32,6 +32,7 @@ class Attachment(BaseModel):
 
 class ChatwootEvent(BaseModel):
     event: str
+    id: Optional[int] = None  # Message id on message_created events
     message_type: Optional[str] = None
     content: Optional[str] = None
     private: Optional[bool] = False
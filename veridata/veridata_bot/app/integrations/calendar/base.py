@@ -6,14 +6,14 @@ class CalendarProvider(ABC):
     """Abstract Base Class for Calendar Providers."""
 
     @abstractmethod
-    def get_available_slots(
+    async def get_available_slots(
         self, start_date: datetime, end_date: datetime
     ) -> List[datetime]:
         """Returns a list of available start times (UTC)."""
         pass
 
     @abstractmethod
-    def book_slot(
+    async def book_slot(
         self,
         start_time: datetime,
         email: str,
@@ -2,8 +2,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Optional
 
-import httpx
-
+from app.core.http import get_http_client
 from app.integrations.calendar.base import CalendarProvider
 
 logger = logging.getLogger(__name__)
@@ -17,7 +16,7 @@ class CalComProvider(CalendarProvider):
         self.event_type_id = event_type_id
         self.base_url = "https://api.cal.com/v1"
 
-    def get_available_slots(
+    async def get_available_slots(
         self, start_date: datetime, end_date: datetime
     ) -> List[datetime]:
         """Fetches available slots from Cal.com."""
@@ -39,27 +38,27 @@ class CalComProvider(CalendarProvider):
             # Note: This is a simplified call. Real Cal.com API usage might need 'username'
             # or different endpoint depending on v1/v2 or self-hosted.
             # Assuming standard v1/slots logic for this provider.
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(f"{self.base_url}/slots", params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                # Parse response. Structure depends on API version.
-                # Common structure: {"slots": {"2024-01-01": [{"time": "..."}]}}
-                slots = []
-                if "slots" in data:
-                    for date_key, day_slots in data["slots"].items():
-                        for slot in day_slots:
-                            if "time" in slot:
-                                dt = datetime.fromisoformat(slot["time"].replace("Z", "+00:00"))
-                                slots.append(dt)
-                return slots
+            client = get_http_client()
+            response = await client.get(f"{self.base_url}/slots", params=params, timeout=10.0)
+            response.raise_for_status()
+            data = response.json()
+
+            # Parse response. Structure depends on API version.
+            # Common structure: {"slots": {"2024-01-01": [{"time": "..."}]}}
+            slots = []
+            if "slots" in data:
+                for date_key, day_slots in data["slots"].items():
+                    for slot in day_slots:
+                        if "time" in slot:
+                            dt = datetime.fromisoformat(slot["time"])  # accepts a trailing "Z" since 3.11
+                            slots.append(dt)
+            return slots
 
         except Exception as e:
             logger.error(f"Cal.com get_available_slots failed: {e}")
             return []
 
-    def book_slot(
+    async def book_slot(
         self,
         start_time: datetime,
         email: str,
@@ -86,16 +85,16 @@ class CalComProvider(CalendarProvider):
         params = {"apiKey": self.api_key}
 
         try:
-            with httpx.Client(timeout=15.0) as client:
-                response = client.post(
-                    f"{self.base_url}/bookings", json=payload, params=params
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                # Check for success
-                # Return UID or confirmation link
-                return f"Booking ID: {data.get('id')} (Check email for link)"
+            client = get_http_client()
+            response = await client.post(
+                f"{self.base_url}/bookings", json=payload, params=params, timeout=15.0
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            # Check for success
+            # Return UID or confirmation link
+            return f"Booking ID: {data.get('id')} (Check email for link)"
 
         except Exception as e:
             logger.error(f"Cal.com booking failed: {e}, Response: {response.text if 'response' in locals() else ''}")
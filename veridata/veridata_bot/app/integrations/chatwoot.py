@@ -1,6 +1,6 @@
 import logging
 
-import httpx
+from app.core.http import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +22,13 @@ class ChatwootClient:
     # message_type='outgoing' means the bot (agent) is speaking.
     # ==================================================================================
     async def send_message(self, conversation_id: str, message: str, message_type: str = "outgoing"):
-        async with httpx.AsyncClient() as client:
-            url = f"{self.base_url}/api/v1/accounts/{self.account_id}/conversations/{conversation_id}/messages"
-            logger.info(f"Sending message to Chatwoot conversation {conversation_id} (Account {self.account_id})")
-            payload = {"content": message, "message_type": message_type, "private": False}
-            resp = await client.post(url, json=payload, headers=self.headers)
-            resp.raise_for_status()
-            return resp.json()
+        client = get_http_client()
+        url = f"{self.base_url}/api/v1/accounts/{self.account_id}/conversations/{conversation_id}/messages"
+        logger.info(f"Sending message to Chatwoot conversation {conversation_id} (Account {self.account_id})")
+        payload = {"content": message, "message_type": message_type, "private": False}
+        resp = await client.post(url, json=payload, headers=self.headers)
+        resp.raise_for_status()
+        return resp.json()
 
     # ==================================================================================
     # METHOD: TOGGLE STATUS
@@ -39,31 +39,31 @@ class ChatwootClient:
     # 'resolved'-> Done
     # ==================================================================================
     async def toggle_status(self, conversation_id: str, status: str):
-        async with httpx.AsyncClient() as client:
-            url = f"{self.base_url}/api/v1/accounts/{self.account_id}/conversations/{conversation_id}/toggle_status"
-            payload = {"status": status}
-            resp = await client.post(url, json=payload, headers=self.headers)
-            resp.raise_for_status()
-            return resp.json()
+        client = get_http_client()
+        url = f"{self.base_url}/api/v1/accounts/{self.account_id}/conversations/{conversation_id}/toggle_status"
+        payload = {"status": status}
+        resp = await client.post(url, json=payload, headers=self.headers)
+        resp.raise_for_status()
+        return resp.json()
 
     # ==================================================================================
     # METHOD: UPDATE CONTACT (Auto-Sync)
     # Updates Lead's email/phone in Chatwoot if discovered by AI.
     # ==================================================================================
     async def update_contact(self, contact_id: int, email: str = None, phone_number: str = None):
-        async with httpx.AsyncClient() as client:
-            url = f"{self.base_url}/api/v1/accounts/{self.account_id}/contacts/{contact_id}"
-            payload = {}
-            if email: payload["email"] = email
-            if phone_number: payload["phone_number"] = phone_number
+        client = get_http_client()
+        url = f"{self.base_url}/api/v1/accounts/{self.account_id}/contacts/{contact_id}"
+        payload = {}
+        if email: payload["email"] = email
+        if phone_number: payload["phone_number"] = phone_number
 
-            if not payload: return
+        if not payload: return
 
-            logger.info(f"Updating Chatwoot Contact {contact_id}: {payload}")
-            resp = await client.put(url, json=payload, headers=self.headers)
-            # Chatwoot sometimes returns 422 if email already taken by another contact.
-            # We log warning but don't crash.
-            if resp.status_code != 200:
-                logger.warning(f"Chatwoot Update Failed: {resp.text}")
-            else:
-                return resp.json()
+        logger.info(f"Updating Chatwoot Contact {contact_id}: {payload}")
+        resp = await client.put(url, json=payload, headers=self.headers)
+        # Chatwoot sometimes returns 422 if email already taken by another contact.
+        # We log warning but don't crash.
+        if resp.status_code != 200:
+            logger.warning(f"Chatwoot Update Failed: {resp.text}")
+        else:
+            return resp.json()
@@ -1,7 +1,8 @@
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
-import httpx
+from app.core.http import get_http_client
 
 import time
 from app.integrations.crm.formatting import ConversationFormatter
@@ -36,14 +37,14 @@ class HubSpotClient:
 
         payload = {"filterGroups": filter_groups, "properties": ["id", "email", "firstname", "lastname"], "limit": 1}
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, headers=self.headers, json=payload)
-            if resp.status_code == 200:
-                data = resp.json()
-                if data["total"] > 0:
-                    return data["results"][0]["id"]
-            else:
-                logger.error(f"HubSpot Search Error: {resp.text}")
+        client = get_http_client()
+        resp = await client.post(url, headers=self.headers, json=payload)
+        if resp.status_code == 200:
+            data = resp.json()
+            if data["total"] > 0:
+                return data["results"][0]["id"]
+        else:
+            logger.error(f"HubSpot Search Error: {resp.text}")
 
         return None
 
@@ -69,18 +70,18 @@ class HubSpotClient:
         properties["firstname"] = first
         properties["lastname"] = last if last else "Unknown"
 
-        async with httpx.AsyncClient() as client:
-            if existing_id:
-                url = f"{self.base_url}/crm/v3/objects/contacts/{existing_id}"
-                await client.patch(url, headers=self.headers, json={"properties": properties})
-                logger.info(f"HubSpot: Updated contact {existing_id}")
+        client = get_http_client()
+        if existing_id:
+            url = f"{self.base_url}/crm/v3/objects/contacts/{existing_id}"
+            await client.patch(url, headers=self.headers, json={"properties": properties})
+            logger.info(f"HubSpot: Updated contact {existing_id}")
+        else:
+            url = f"{self.base_url}/crm/v3/objects/contacts"
+            resp = await client.post(url, headers=self.headers, json={"properties": properties})
+            if resp.status_code == 201:
+                logger.info("HubSpot: Created new contact")
             else:
-                url = f"{self.base_url}/crm/v3/objects/contacts"
-                resp = await client.post(url, headers=self.headers, json={"properties": properties})
-                if resp.status_code == 201:
-                    logger.info("HubSpot: Created new contact")
-                else:
-                    logger.error(f"HubSpot Create Error: {resp.text}")
+                logger.error(f"HubSpot Create Error: {resp.text}")
 
     async def sync_contact(self, payload: Dict[str, Any]):
         """Syncs a contact object (usually from Chatwoot payload) to HubSpot.
@@ -134,9 +135,15 @@ class HubSpotClient:
             ],
         }
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, headers=self.headers, json=payload)
-            if resp.status_code == 201:
-                logger.info(f"HubSpot: Added summary note to contact {contact_id}")
-            else:
-                logger.error(f"HubSpot Note Error: {resp.text}")
+        client = get_http_client()
+        resp = await client.post(url, headers=self.headers, json=payload)
+        if resp.status_code == 201:
+            logger.info(f"HubSpot: Added summary note to contact {contact_id}")
+        else:
+            logger.error(f"HubSpot Note Error: {resp.text}")
+
+
+@lru_cache(maxsize=256)
+def get_hubspot_client(access_token: str) -> HubSpotClient:
+    """Returns a HubSpotClient per access token, reused across requests."""
+    return HubSpotClient(access_token=access_token)
@@ -1,8 +1,9 @@
 import base64
 import logging
 import uuid
+from functools import lru_cache
 
-import httpx
+from app.core.http import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -16,37 +17,42 @@ class RagClient:
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.tenant_id = tenant_id
+        self._headers = self._build_headers()
 
     async def create_session(self) -> str | None:
         """Explicitly create a new details session."""
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            url = f"{self.base_url}/api/session"
-            headers = self._get_headers()
-            payload = {"tenant_id": self.tenant_id}
-
-            try:
-                resp = await client.post(url, json=payload, headers=headers)
-                resp.raise_for_status()
-                data = resp.json()
-                return str(data.get("session_id"))
-            except Exception as e:
-                logger.error(f"Failed to create RAG session: {e}")
-                return None
+        client = get_http_client()
+        url = f"{self.base_url}/api/session"
+        headers = self._get_headers()
+        payload = {"tenant_id": self.tenant_id}
+
+        try:
+            resp = await client.post(url, json=payload, headers=headers, timeout=10.0)
+            resp.raise_for_status()
+            data = resp.json()
+            return str(data.get("session_id"))
+        except Exception as e:
+            logger.error(f"Failed to create RAG session: {e}")
+            return None
 
     async def append_message(self, session_id: uuid.UUID, role: str, content: str):
         """Manually append a message to the RAG history."""
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            url = f"{self.base_url}/api/session/{session_id}/messages"
-            headers = self._get_headers()
-            payload = {"role": role, "content": content}
+        client = get_http_client()
+        url = f"{self.base_url}/api/session/{session_id}/messages"
+        headers = self._get_headers()
+        payload = {"role": role, "content": content}
 
-            try:
-                resp = await client.post(url, json=payload, headers=headers)
-                resp.raise_for_status()
-            except Exception as e:
-                logger.error(f"Failed to append message to RAG session {session_id}: {e}")
+        try:
+            resp = await client.post(url, json=payload, headers=headers, timeout=10.0)
+            resp.raise_for_status()
+        except Exception as e:
+            logger.error(f"Failed to append message to RAG session {session_id}: {e}")
 
     def _get_headers(self):
+        """Returns the Authorization headers (built once per client)."""
+        return self._headers
+
+    def _build_headers(self):
         """Helper to construct Authorization headers."""
         headers = {}
         if self.api_key:
@@ -72,78 +78,84 @@ class RagClient:
         external_context: str | None = None,
         **kwargs,
     ) -> dict:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            url = f"{self.base_url}/api/query"
+        client = get_http_client()
+        url = f"{self.base_url}/api/query"
 
-            payload = {
-                "query": message,
-                "tenant_id": self.tenant_id,
-                "complexity_score": complexity_score,
-                "pricing_intent": pricing_intent,
-                "external_context": external_context,
-                **kwargs,
-            }
+        payload = {
+            "query": message,
+            "tenant_id": self.tenant_id,
+            "complexity_score": complexity_score,
+            "pricing_intent": pricing_intent,
+            "external_context": external_context,
+            **kwargs,
+        }
 
-            logger.info(f"RAG Request to {url}. Payload: {payload}")
+        logger.info(f"RAG Request to {url}. Payload: {payload}")
 
-            if session_id:
-                payload["session_id"] = str(session_id)
+        if session_id:
+            payload["session_id"] = str(session_id)
 
-            headers = self._get_headers()
+        headers = self._get_headers()
 
-            resp = await client.post(url, json=payload, headers=headers)
+        resp = await client.post(url, json=payload, headers=headers, timeout=60.0)
 
-            if resp.status_code != 200:
-                logger.error(f"RAG Error {resp.status_code}: {resp.text}")
+        if resp.status_code != 200:
+            logger.error(f"RAG Error {resp.status_code}: {resp.text}")
 
-            resp.raise_for_status()
-            return resp.json()
+        resp.raise_for_status()
+        return resp.json()
 
     # ==================================================================================
     # METHOD: SUMMARIZE
     # Asks RAG to summarize a session (unused? logic moved to Bot/Summarizer?)
     # ==================================================================================
     async def summarize(self, session_id: uuid.UUID, provider: str = "gemini") -> dict:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            url = f"{self.base_url}/api/summarize"
+        client = get_http_client()
+        url = f"{self.base_url}/api/summarize"
 
-            payload = {"tenant_id": self.tenant_id, "session_id": str(session_id), "provider": provider}
+        payload = {"tenant_id": self.tenant_id, "session_id": str(session_id), "provider": provider}
 
-            logger.info(f"Requesting summary for session {session_id}")
-            headers = self._get_headers()
+        logger.info(f"Requesting summary for session {session_id}")
+        headers = self._get_headers()
 
-            resp = await client.post(url, json=payload, headers=headers)
-            resp.raise_for_status()
-            return resp.json()
+        resp = await client.post(url, json=payload, headers=headers, timeout=60.0)
+        resp.raise_for_status()
+        return resp.json()
 
     # ==================================================================================
     # METHOD: DELETE SESSION
     # Cleans up memory references in RAG service.
     # ==================================================================================
     async def delete_session(self, session_id: uuid.UUID) -> dict:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            url = f"{self.base_url}/api/session/{session_id}"
+        client = get_http_client()
+        url = f"{self.base_url}/api/session/{session_id}"
 
-            headers = self._get_headers()
+        headers = self._get_headers()
 
-            logger.info(f"Deleting RAG session {session_id}")
-            resp = await client.delete(url, headers=headers)
-            if resp.status_code == 404:
-                return {"status": "already_deleted"}
-            resp.raise_for_status()
-            return resp.json()
+        logger.info(f"Deleting RAG session {session_id}")
+        resp = await client.delete(url, headers=headers, timeout=10.0)
+        if resp.status_code == 404:
+            return {"status": "already_deleted"}
+        resp.raise_for_status()
+        return resp.json()
 
     # ==================================================================================
     # METHOD: GET HISTORY
     # Retrieves chat transcript for LangGraph context or Summarization.
     # ==================================================================================
     async def get_history(self, session_id: uuid.UUID) -> list[dict]:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            url = f"{self.base_url}/api/session/{session_id}/history"
-            headers = self._get_headers()
+        client = get_http_client()
+        url = f"{self.base_url}/api/session/{session_id}/history"
+        headers = self._get_headers()
 
-            resp = await client.get(url, headers=headers)
-            if resp.status_code == 404:
-                return []
-            resp.raise_for_status()
-            return resp.json().get("messages", [])
+        resp = await client.get(url, headers=headers, timeout=10.0)
+        if resp.status_code == 404:
+            return []
+        resp.raise_for_status()
+        return resp.json().get("messages", [])
+
+
+@lru_cache(maxsize=256)
+def get_rag_client(base_url: str, api_key: str, tenant_id: str) -> RagClient:
+    """Returns a RagClient per (base_url, api_key, tenant), reused across requests."""
+    return RagClient(base_url=base_url, api_key=api_key, tenant_id=tenant_id)
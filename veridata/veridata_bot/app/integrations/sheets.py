@@ -1,71 +1,179 @@
+import asyncio
 import csv
 import logging
+import time
 from io import StringIO
 
-import httpx
+from app.core.config import settings
+from app.core.http import get_http_client
 
 logger = logging.getLogger(__name__)
 
+# In-flight / recent CSV downloads keyed by export URL. Lets the agent pipeline start the
+# download as soon as a message arrives and the pricing tool await the same task later.
+# Within settings.sheet_cache_ttl, lookups reuse the same result without touching the network.
+_sheet_downloads: dict[str, tuple[float, asyncio.Task]] = {}
+
+# A failed download (private sheet, bad URL, timeout) is also reused, for a shorter window,
+# so a misconfigured tenant fails fast instead of paying the network error on every turn
+_SHEET_FAILURE_TTL_SECONDS = 30.0
+
+# Last body per export URL with its validators, for conditional re-downloads after the TTL
+_sheet_validators: dict[str, tuple[str | None, str | None, str]] = {}
+
+# Parsed rows per export URL, tagged with the body they came from. While the download
+# cache keeps handing back the same body, lookups skip CSV parsing entirely.
+_sheet_rows: dict[str, tuple[str, list[tuple[str, str, str, str, str]]]] = {}
+
+# Each cache above holds at most this many URLs; the least recently stored one is dropped
+_SHEET_CACHE_MAX = 256
+
+
+def _remember(cache: dict, key: str, value) -> None:
+    # Re-insert so dict order tracks recency, then evict from the front
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > _SHEET_CACHE_MAX:
+        del cache[next(iter(cache))]
+
+
+def _export_url(url: str) -> str:
+    if "/edit" in url:
+        return url.split("/edit")[0] + "/export?format=csv"
+    if "/view" in url:
+        return url.split("/view")[0] + "/export?format=csv"
+    return url
+
+
+async def _download_csv(url: str) -> str:
+    headers = {}
+    cached = _sheet_validators.get(url)
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    logger.info(f"🌐 Fetching live data from: {url}")
+    # Export URLs redirect to googleusercontent; both hosts stay warm in the shared pool
+    client = get_http_client()
+    response = await client.get(url, headers=headers, timeout=30.0, follow_redirects=True)
+
+    if response.status_code == 304 and cached:
+        logger.info("Sheet not modified since last download (304). Reusing cached copy.")
+        return cached[2]
+
+    response.raise_for_status()
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        _remember(_sheet_validators, url, (etag, last_modified, response.text))
+    return response.text
+
+
+def _get_sheet_csv(url: str) -> asyncio.Task:
+    """Returns the running or recently finished download task for url, starting one if needed."""
+    now = time.monotonic()
+    entry = _sheet_downloads.get(url)
+    if entry and not entry[1].cancelled():
+        stamp, task = entry
+        failed = task.done() and task.exception() is not None
+        ttl = _SHEET_FAILURE_TTL_SECONDS if failed else settings.sheet_cache_ttl
+        if now - stamp < ttl:
+            return task
+
+    task = asyncio.create_task(_download_csv(url))
+    task.add_done_callback(lambda t: _on_download_done(url, t))
+    _remember(_sheet_downloads, url, (now, task))
+    return task
+
+
+def _on_download_done(url: str, task: asyncio.Task) -> None:
+    # Retrieving the exception also marks it handled if nobody ends up awaiting a prefetch
+    if task.cancelled() or task.exception() is None:
+        return
+    # Failures are remembered from when they happened, not from when the download began
+    entry = _sheet_downloads.get(url)
+    if entry and entry[1] is task:
+        _sheet_downloads[url] = (time.monotonic(), task)
+
+
+def _parse_rows(url: str, csv_text: str) -> list[tuple[str, str, str, str, str]]:
+    """Returns (name, price, sku, description, ai_notes) for every row of the sheet."""
+    cached = _sheet_rows.get(url)
+    if cached and cached[0] is csv_text:
+        return cached[1]
+
+    rows = []
+    for row in csv.DictReader(StringIO(csv_text)):
+        rows.append((
+            row.get("Product Name") or row.get("item_name"),
+            row.get("Price") or row.get("item_price"),
+            row.get("ID / SKU") or row.get("item_id"),
+            row.get("Description (AI Context)") or row.get("item_desc") or "",
+            row.get("AI Notes (Hidden Rules)") or row.get("context") or "",
+        ))
+    _remember(_sheet_rows, url, (csv_text, rows))
+    return rows
+
+
+def prefetch_google_sheet(url: str) -> None:
+    """Starts downloading the sheet in the background so a later lookup can reuse it."""
+    _get_sheet_csv(_export_url(url))
+
 
 async def fetch_google_sheet_data(url: str, query: str = None) -> str:
     try:
-        if "/edit" in url:
-            url = url.split("/edit")[0] + "/export?format=csv"
-        elif "/view" in url:
-            url = url.split("/view")[0] + "/export?format=csv"
-
-        logger.info(f"🌐 Fetching live data from: {url}")
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-
-            f = StringIO(response.text)
-            reader = csv.DictReader(f)
-
-            items = []
-            rows_processed = 0
-            for row in reader:
-                rows_processed += 1
-                name = row.get("Product Name") or row.get("item_name")
-                price = row.get("Price") or row.get("item_price")
-                sku = row.get("ID / SKU") or row.get("item_id")
-                item_desc = row.get("Description (AI Context)") or row.get("item_desc") or ""
-                ai_notes = row.get("AI Notes (Hidden Rules)") or row.get("context") or ""
-
-                # --- Filtering Logic ---
-                if query:
-                    # Basic case-insensitive keyword match
-                    query_lower = query.lower()
-                    # Check name, description, SKU
-                    search_target = f"{name} {item_desc} {sku} {ai_notes}".lower()
-                    if query_lower not in search_target:
-                        continue
-                # -----------------------
-
-                # Combine description and hidden rules
-                full_context = []
-                if item_desc: full_context.append(f"Desc: {item_desc}")
-                if ai_notes: full_context.append(f"Rules: {ai_notes}")
-                context_str = " | ".join(full_context)
-
-                if name:
-                    items.append(f"* {name} ({sku}): {price} | {context_str}")
-
-            logger.info(f"📋 Sheet processing complete. Filter: '{query or 'ALL'}'. Rows: {rows_processed}, Matches: {len(items)}")
-
-            if not items:
-                if query:
-                    return f"No products found matching '{query}'."
-                logger.warning("Empty items list after processing CSV.")
-                return ""
-
-            # Simple truncation for safety if filtering returns too many
-            if len(items) > 50:
-                 return f"[TOO MANY RESULTS] Found {len(items)} items matching '{query}'. Please be more specific."
-
-            res = "\n[LIVE PRICING & PRODUCT DATA]\n" + "\n".join(items) + "\n(Source: Live Google Sheet)\n\n"
-            logger.info(f"DEBUG: Pricing Data being sent to Agent:\n{res}")
-            return res
+        url = _export_url(url)
+        # shield: the download is shared across conversations; one caller being cancelled
+        # (e.g. its agent run timing out) must not cancel it for everyone else
+        csv_text = await asyncio.shield(_get_sheet_csv(url))
+        rows = _parse_rows(url, csv_text)
+
+        query_lower = query.lower() if query else None
+
+        items = []
+        rows_processed = 0
+        for name, price, sku, item_desc, ai_notes in rows:
+            rows_processed += 1
+
+            # --- Filtering Logic ---
+            if query:
+                # Basic case-insensitive keyword match
+                # Check name, description, SKU
+                search_target = f"{name} {item_desc} {sku} {ai_notes}".lower()
+                if query_lower not in search_target:
+                    continue
+            # -----------------------
+
+            # Combine description and hidden rules
+            full_context = []
+            if item_desc: full_context.append(f"Desc: {item_desc}")
+            if ai_notes: full_context.append(f"Rules: {ai_notes}")
+            context_str = " | ".join(full_context)
+
+            if name:
+                items.append(f"* {name} ({sku}): {price} | {context_str}")
+
+        logger.info(
+            f"📋 Sheet processing complete. Filter: '{query or 'ALL'}'. "
+            f"Rows: {rows_processed}, Matches: {len(items)}"
+        )
+
+        if not items:
+            if query:
+                return f"No products found matching '{query}'."
+            logger.warning("Empty items list after processing CSV.")
+            return ""
+
+        # Simple truncation for safety if filtering returns too many
+        if len(items) > 50:
+             return f"[TOO MANY RESULTS] Found {len(items)} items matching '{query}'. Please be more specific."
+
+        res = "\n[LIVE PRICING & PRODUCT DATA]\n" + "\n".join(items) + "\n(Source: Live Google Sheet)\n\n"
+        logger.info(f"DEBUG: Pricing Data being sent to Agent:\n{res}")
+        return res
     except Exception as e:
         logger.error(f"Failed to fetch Google Sheet: {e}")
         return ""
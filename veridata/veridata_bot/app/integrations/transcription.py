@@ -1,42 +1,51 @@
+import asyncio
 import logging
-import os
+from functools import cache
 from app.core.config import settings
-from app.core.llm_config import get_llm_config
+from app.core.llm_config import get_llm_config, llm_semaphore
 
 logger = logging.getLogger(__name__)
 
+TRANSCRIPTION_TIMEOUT_SECONDS = 60.0
+
 
 from google import genai
 from google.genai import types
 
 
+@cache
+def _get_genai_client(api_key: str) -> genai.Client:
+    # Built once per key so its HTTP session is reused across transcriptions
+    return genai.Client(api_key=api_key)
+
+
 async def transcribe_gemini(file_bytes: bytes, mime_type: str = "audio/mp3") -> str:
+    # Settings already reads GOOGLE_API_KEY from the environment once at startup
     api_key = settings.google_api_key
-    if not api_key:
-        api_key = os.getenv("GOOGLE_API_KEY")
-
     if not api_key:
         raise ValueError("GOOGLE_API_KEY not set")
 
-    client = genai.Client(api_key=api_key)
+    client = _get_genai_client(api_key)
 
     config = await get_llm_config()
-    model_name = config.get("model_name", "gemini-2.0-flash")
-    if not model_name:
-         model_name = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
+    model_name = config.get("model_name") or settings.gemini_model
 
     try:
-        response = client.models.generate_content(
-            model=model_name,
-            contents=[
-                types.Content(
-                    parts=[
-                        types.Part.from_text(text="Transcribe this audio file exactly as spoken."),
-                        types.Part.from_bytes(data=file_bytes, mime_type=mime_type),
-                    ]
-                )
-            ],
-        )
+        # Async surface so the upload + inference do not block the event loop;
+        # shares the process-wide Gemini concurrency cap with the agent and summarizer.
+        # The deadline covers time queued for a slot as well as the request itself.
+        async with asyncio.timeout(TRANSCRIPTION_TIMEOUT_SECONDS), llm_semaphore:
+            response = await client.aio.models.generate_content(
+                model=model_name,
+                contents=[
+                    types.Content(
+                        parts=[
+                            types.Part.from_text(text="Transcribe this audio file exactly as spoken."),
+                            types.Part.from_bytes(data=file_bytes, mime_type=mime_type),
+                        ]
+                    )
+                ],
+            )
         return response.text
     except Exception as e:
         logger.error(f"Gemini Transcription failed: {e}")
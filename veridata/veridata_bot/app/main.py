@@ -1,15 +1,27 @@
 import logging
+from contextlib import asynccontextmanager
+import orjson
 from fastapi import BackgroundTasks, FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 from app.api.endpoints import router as api_router
 from app.bot.engine import process_bot_event, process_integration_event
 from app.core.db import async_session_maker
+from app.core.http import close_http_client
 from app.core.logging import setup_logging
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Veridata Bot")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_http_client()
+
+
+app = FastAPI(title="Veridata Bot", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 @app.get("/", include_in_schema=False)
@@ -35,14 +47,18 @@ app.include_router(api_router, prefix="/api/v1")
 
 @app.post("/bot/chatwoot/{client_slug}")
 async def chatwoot_bot_handler(client_slug: str, request: Request, background_tasks: BackgroundTasks):
-    payload = await request.json()
+    body = await request.body()
+    # The bot only acts on message_created; drop every other event before parsing/scheduling
+    if b'"message_created"' not in body:
+        return {"status": "ignored_event"}
+    payload = orjson.loads(body)
     background_tasks.add_task(run_bot_bg, client_slug, payload)
     return {"status": "processing_started"}
 
 
 @app.post("/integrations/chatwoot/{client_slug}")
 async def chatwoot_integration_handler(client_slug: str, request: Request, background_tasks: BackgroundTasks):
-    payload = await request.json()
+    payload = orjson.loads(await request.body())
     background_tasks.add_task(run_integration_bg, client_slug, payload)
     return {"status": "processing_started"}
 
@@ -11,7 +11,7 @@ class ServiceConfig(Base):
     __tablename__ = "service_configs"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    client_id: Mapped[int] = mapped_column(ForeignKey("clients.id"), nullable=False)
+    client_id: Mapped[int] = mapped_column(ForeignKey("clients.id"), index=True, nullable=False)
     config: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
 
     client = relationship("Client", back_populates="configs")
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -9,10 +9,11 @@ from app.models.base import Base
 
 class BotSession(Base):
     __tablename__ = "bot_sessions"
+    __table_args__ = (Index("ix_bot_sessions_client_ext", "client_id", "external_session_id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     client_id: Mapped[int] = mapped_column(ForeignKey("clients.id"), nullable=False)
-    external_session_id: Mapped[str] = mapped_column(String, index=True, nullable=False)  # Chatwoot Conversation ID
+    external_session_id: Mapped[str] = mapped_column(String, nullable=False)  # Chatwoot Conversation ID
     rag_session_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
 
     client = relationship("Client", back_populates="sessions")
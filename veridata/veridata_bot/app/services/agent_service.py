@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import uuid
+from functools import lru_cache
 from typing import Dict, Any, Tuple
 
 from sqlalchemy import update
@@ -9,12 +11,29 @@ from langfuse.langchain import CallbackHandler
 
 from app.agent.graph import get_agent_app
 from app.agent.prompts import AGENT_SYSTEM_PROMPT
-from app.core.llm_config import get_llm_config
-from app.integrations.rag import RagClient
+from app.core.llm_config import get_llm_config, invoke_llm
+from app.integrations.rag import get_rag_client
+from app.integrations.sheets import prefetch_google_sheet
 from app.models.session import BotSession
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for a whole agent run, tool calls included
+AGENT_TIMEOUT_SECONDS = 60.0
+
+# Most tenants have no custom instructions; build their system message once
+_DEFAULT_SYSTEM_MESSAGE = SystemMessage(content=AGENT_SYSTEM_PROMPT)
+
+
+@lru_cache(maxsize=256)
+def _system_message_for(custom_instructions: str) -> SystemMessage:
+    # Built once per distinct instruction text rather than on every turn
+    if not custom_instructions:
+        return _DEFAULT_SYSTEM_MESSAGE
+    return SystemMessage(
+        content=f"{AGENT_SYSTEM_PROMPT}\n\n**CUSTOM CLIENT INSTRUCTIONS (OVERRIDE DEFAULT):**\n{custom_instructions}"
+    )
+
 async def run_agent_pipeline(
     db: AsyncSession,
     session: BotSession,
@@ -35,31 +54,21 @@ async def run_agent_pipeline(
     rag_config = configs.get("rag", {})
     client_config = configs.get("client_config", {})
 
-    # --- 1. Fetch History ---
-    history_messages = []
-    if session.rag_session_id:
-        try:
-            rag_client = RagClient(
-                base_url=rag_config["base_url"],
-                api_key=rag_config.get("api_key", ""),
-                tenant_id=rag_config["tenant_id"],
-            )
-            history_data = await rag_client.get_history(session.rag_session_id)
-            for msg in history_data:
-                if msg["role"] == "user":
-                    history_messages.append(HumanMessage(content=msg["content"]))
-                elif msg["role"] == "ai":
-                    history_messages.append(AIMessage(content=msg["content"]))
-        except Exception as e:
-            logger.warning(f"Failed to fetch chat history: {e}")
+    # Start the pricing sheet download now; lookup_pricing awaits the same task if the agent calls it
+    if rag_config.get("google_sheets_url"):
+        prefetch_google_sheet(rag_config["google_sheets_url"])
+
+    # --- 1. Fetch History + Model Config ---
+    # Independent I/O (RAG service, GlobalConfig row): run both at once
+    history_messages, llm_settings = await asyncio.gather(
+        _load_history(session, rag_config),
+        get_llm_config(db),
+    )
 
     # --- 2. Build Prompt ---
-    custom_instructions = client_config.get("custom_instructions", "")
-    final_system_prompt = AGENT_SYSTEM_PROMPT
-    if custom_instructions:
-        final_system_prompt += f"\n\n**CUSTOM CLIENT INSTRUCTIONS (OVERRIDE DEFAULT):**\n{custom_instructions}"
+    system_message = _system_message_for(client_config.get("custom_instructions") or "")
 
-    full_messages = [SystemMessage(content=final_system_prompt)] + history_messages + [HumanMessage(content=user_query)]
+    full_messages = [system_message, *history_messages, HumanMessage(content=user_query)]
 
     # --- 3. Run Agent ---
     initial_state = {"messages": full_messages}
@@ -68,7 +77,8 @@ async def run_agent_pipeline(
     run_config = {
         "rag_config": rag_config,
         "google_sheets_url": rag_config.get("google_sheets_url"),
-        "rag_session_id": str(session.rag_session_id) if session.rag_session_id else None,
+        # Already a uuid.UUID from the BotSession row; the tool uses it without re-validating
+        "rag_session_id": session.rag_session_id,
         "client_config": client_config # For is_enterprise flag
     }
 
@@ -84,14 +94,15 @@ async def run_agent_pipeline(
         langfuse_handler = CallbackHandler()
 
         # Get Dynamic Model
-        llm_settings = await get_llm_config()
         model_name = llm_settings.get("model_name", "gemini-2.0-flash-exp")
         agent_app = get_agent_app(model_name)
 
         logger.info(f"🤖 Executing Agent with model: {model_name}")
 
-        result = await agent_app.ainvoke(
+        result = await invoke_llm(
+            agent_app,
             initial_state,
+            timeout=AGENT_TIMEOUT_SECONDS,
             config={
                 "callbacks": [langfuse_handler],
                 "metadata": {
@@ -138,22 +149,43 @@ async def run_agent_pipeline(
 
         return answer, requires_human
 
+    except TimeoutError:
+        logger.error(f"Agent Execution timed out after {AGENT_TIMEOUT_SECONDS}s")
+        return "I apologize, but I encountered an internal error.", False
     except Exception as e:
         logger.error(f"Agent Execution Failed: {e}", exc_info=True)
         return "I apologize, but I encountered an internal error.", False
 
 
+async def _load_history(session: BotSession, rag_config: dict) -> list:
+    """
+    Loads the previous turns of this conversation from the RAG service as LangChain messages.
+    """
+    history_messages = []
+    if not session.rag_session_id:
+        return history_messages
+
+    try:
+        rag_client = get_rag_client(rag_config["base_url"], rag_config.get("api_key", ""), rag_config["tenant_id"])
+        history_data = await rag_client.get_history(session.rag_session_id)
+        for msg in history_data:
+            if msg["role"] == "user":
+                history_messages.append(HumanMessage(content=msg["content"]))
+            elif msg["role"] == "ai":
+                history_messages.append(AIMessage(content=msg["content"]))
+    except Exception as e:
+        logger.warning(f"Failed to fetch chat history: {e}")
+
+    return history_messages
+
+
 async def _persist_history(db: AsyncSession, session: BotSession, rag_config: dict, query: str, answer: str):
     """
     Helper to sync the interaction back to the RAG service history.
     Handles session creation if RAG session does not exist.
     """
     try:
-        rag_client = RagClient(
-            base_url=rag_config["base_url"],
-            api_key=rag_config.get("api_key", ""),
-            tenant_id=rag_config["tenant_id"],
-        )
+        rag_client = get_rag_client(rag_config["base_url"], rag_config.get("api_key", ""), rag_config["tenant_id"])
 
         # Ensure RAG ID exists
         if not session.rag_session_id:
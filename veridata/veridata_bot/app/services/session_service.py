@@ -20,8 +20,7 @@ async def get_or_create_bot_session(
         BotSession.external_session_id == conversation_id
     )
 
-    sess_result = await db.execute(session_query)
-    session = sess_result.scalars().first()
+    session = await db.scalar(session_query)
 
     if not session:
         log_start(logger, f"Creating new BotSession for conversation {conversation_id}")
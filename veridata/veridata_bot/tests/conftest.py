@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from langchain_core.messages import AIMessage
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
@@ -70,18 +71,12 @@ def mock_chatwoot_response(mocker):
     return mock
 
 @pytest.fixture(autouse=True)
-def mock_llm_router(mocker):
+def mock_agent_app(mocker):
     """
-    Mock the LLM used in the router node to avoid external API calls.
-    Returns a JSON that forces 'rag' intent.
+    Mock the compiled agent graph to avoid external API calls.
+    Returns a plain answer with no tool calls (no human handoff).
     """
-    mock_llm_class = mocker.patch("app.agent.nodes.ChatGoogleGenerativeAI")
-    mock_llm_instance = mock_llm_class.return_value
-
-    # Mock ainvoke to return a valid JSON string for the router
-    # Router expects: {"requires_rag": true, "requires_human": false, ...}
-    mock_response = MagicMock()
-    mock_response.content = '{"requires_rag": true, "requires_human": false, "complexity_score": 5, "pricing_intent": false, "reason": "Test"}'
-
-    mock_llm_instance.ainvoke = AsyncMock(return_value=mock_response)
-    return mock_llm_instance
+    mock_app = MagicMock()
+    mock_app.ainvoke = AsyncMock(return_value={"messages": [AIMessage(content="Hello! I am the Veridata assistant.")]})
+    mocker.patch("app.services.agent_service.get_agent_app", return_value=mock_app)
+    return mock_app
@@ -1,6 +1,7 @@
+import asyncio
 import sys
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 # Add app to path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -8,7 +9,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 from app.integrations.calendar.factory import get_calendar_provider
 from app.integrations.calendar.calcom import CalComProvider
 
-def test_calcom_factory():
+async def test_calcom_factory():
     print("Testing Calendar Factory...")
 
     config = {
@@ -30,7 +31,8 @@ def test_calcom_factory():
 
     # Test dummy calls (won't work without real key, but checks Interface)
     try:
-        slots = provider.get_available_slots(datetime.utcnow(), datetime.utcnow() + timedelta(days=1))
+        now = datetime.now(timezone.utc)
+        slots = await provider.get_available_slots(now, now + timedelta(days=1))
         print(f"✅ API Call Successful! Found {len(slots)} slots.")
         for slot in slots[:3]:
             print(f"   - {slot}")
@@ -38,4 +40,4 @@ def test_calcom_factory():
         print(f"⚠️ API Call failed: {e}")
 
 if __name__ == "__main__":
-    test_calcom_factory()
+    asyncio.run(test_calcom_factory())
@@ -0,0 +1,83 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.bot import engine
+from app.bot.actions import Tenant
+
+CONFIGS = {
+    "rag": {"base_url": "http://rag", "tenant_id": "t1", "api_key": "k"},
+    "chatwoot": {"base_url": "http://chatwoot", "api_key": "k", "account_id": 1},
+}
+
+
+def _payload(message_id: int) -> dict:
+    return {
+        "event": "message_created",
+        "id": message_id,
+        "message_type": "incoming",
+        "content": "Hello?",
+        "conversation": {"id": 42, "status": "pending"},
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_seen_messages():
+    engine._seen_messages.clear()
+    yield
+    engine._seen_messages.clear()
+
+
+@pytest.fixture
+def db():
+    session = MagicMock()
+    session.commit = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def pipeline(mocker):
+    mocker.patch.object(
+        engine, "get_client_and_config", new_callable=AsyncMock, return_value=(Tenant(id=1, slug="acme"), CONFIGS)
+    )
+    mocker.patch.object(
+        engine, "check_subscription_quota", new_callable=AsyncMock, return_value=MagicMock(usage_count=0)
+    )
+    mocker.patch.object(engine, "get_or_create_bot_session", new_callable=AsyncMock)
+    return mocker.patch.object(engine, "run_agent_pipeline", new_callable=AsyncMock, return_value=("Hi!", False))
+
+
+@pytest.mark.asyncio
+async def test_redelivered_message_is_processed_once(db, pipeline):
+    assert (await engine.process_bot_event("acme", _payload(7), db))["status"] == "processed"
+    assert (await engine.process_bot_event("acme", _payload(7), db))["status"] == "duplicate"
+    assert pipeline.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_same_message_id_from_another_tenant_is_not_a_duplicate(db, pipeline):
+    assert (await engine.process_bot_event("acme", _payload(7), db))["status"] == "processed"
+    assert (await engine.process_bot_event("globex", _payload(7), db))["status"] == "processed"
+    assert pipeline.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_delivery_that_fails_before_acceptance_can_be_retried(db, pipeline, mocker):
+    mocker.patch.object(
+        engine, "check_subscription_quota", new_callable=AsyncMock, side_effect=[None, MagicMock(usage_count=0)]
+    )
+
+    assert (await engine.process_bot_event("acme", _payload(7), db))["status"] == "quota_exceeded"
+    assert (await engine.process_bot_event("acme", _payload(7), db))["status"] == "processed"
+    assert pipeline.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_seen_messages_evict_the_oldest_entry(db, pipeline, mocker):
+    mocker.patch.object(engine, "_SEEN_MAX", 2)
+
+    for message_id in (1, 2, 3):
+        await engine.process_bot_event("acme", _payload(message_id), db)
+
+    assert list(engine._seen_messages) == [("acme", 2), ("acme", 3)]
+    assert (await engine.process_bot_event("acme", _payload(1), db))["status"] == "processed"
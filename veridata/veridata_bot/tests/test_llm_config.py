@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from app.core import llm_config
+
+
+@pytest.fixture
+def semaphore(mocker):
+    semaphore = asyncio.Semaphore(1)
+    mocker.patch.object(llm_config, "llm_semaphore", semaphore)
+    return semaphore
+
+
+@pytest.fixture
+def model(mocker):
+    async def fake_agenerate(self, *args, **kwargs):
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="ok"))])
+
+    mocker.patch.object(ChatGoogleGenerativeAI, "_agenerate", fake_agenerate)
+    return llm_config._BoundedChatGoogleGenerativeAI(model="gemini-2.0-flash", google_api_key="test")
+
+
+@pytest.mark.asyncio
+async def test_model_request_releases_its_slot(semaphore, model):
+    result = await llm_config.invoke_llm(model, "hi", timeout=1.0)
+
+    assert result.content == "ok"
+    assert not semaphore.locked()
+
+
+@pytest.mark.asyncio
+async def test_timeout_covers_time_queued_for_a_slot(semaphore, model):
+    async with semaphore:
+        with pytest.raises(TimeoutError):
+            await llm_config.invoke_llm(model, "hi", timeout=0.05)
+
+    # The slot frees up again once the holder is done
+    assert (await llm_config.invoke_llm(model, "hi", timeout=1.0)).content == "ok"
@@ -0,0 +1,148 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from app.integrations import sheets
+
+SHEET_URL = "https://docs.google.com/spreadsheets/d/abc123/edit#gid=0"
+EXPORT_URL = "https://docs.google.com/spreadsheets/d/abc123/export?format=csv"
+CSV_BODY = "Product Name,Price,ID / SKU\nWidget,$10,W1\nGadget,$20,G2\n"
+
+
+def _response(status_code: int, text: str = "", headers: dict | None = None) -> httpx.Response:
+    return httpx.Response(status_code, text=text, headers=headers, request=httpx.Request("GET", EXPORT_URL))
+
+
+@pytest.fixture(autouse=True)
+def reset_sheet_caches():
+    sheets._sheet_downloads.clear()
+    sheets._sheet_validators.clear()
+    sheets._sheet_rows.clear()
+    yield
+    sheets._sheet_downloads.clear()
+    sheets._sheet_validators.clear()
+    sheets._sheet_rows.clear()
+
+
+@pytest.fixture
+def clock(mocker):
+    """Controls the module's monotonic clock without touching the event loop's."""
+    now = [1000.0]
+    mocker.patch.object(sheets, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def http_client(mocker):
+    client = MagicMock()
+    client.get = AsyncMock()
+    mocker.patch("app.integrations.sheets.get_http_client", return_value=client)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_not_modified_reuses_cached_body(http_client, clock):
+    http_client.get.side_effect = [
+        _response(200, CSV_BODY, {"ETag": '"v1"'}),
+        _response(304),
+    ]
+
+    first = await sheets.fetch_google_sheet_data(SHEET_URL)
+
+    # Past the TTL: re-download conditionally
+    clock[0] += sheets.settings.sheet_cache_ttl + 1
+    second = await sheets.fetch_google_sheet_data(SHEET_URL)
+
+    assert http_client.get.await_count == 2
+    assert http_client.get.await_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert "* Widget (W1): $10" in second
+    assert second == first
+
+
+@pytest.mark.asyncio
+async def test_reuses_download_and_parsed_rows_within_ttl(http_client, clock):
+    http_client.get.return_value = _response(200, CSV_BODY)
+
+    await sheets.fetch_google_sheet_data(SHEET_URL)
+    rows = sheets._sheet_rows[EXPORT_URL][1]
+
+    clock[0] += sheets.settings.sheet_cache_ttl - 1
+    result = await sheets.fetch_google_sheet_data(SHEET_URL, "gadget")
+
+    assert http_client.get.await_count == 1
+    assert sheets._sheet_rows[EXPORT_URL][1] is rows
+    assert "* Gadget (G2): $20" in result
+
+
+@pytest.mark.asyncio
+async def test_failure_is_negatively_cached_then_retried(http_client, clock):
+    http_client.get.side_effect = [
+        httpx.ConnectError("boom"),
+        _response(200, CSV_BODY),
+    ]
+
+    assert await sheets.fetch_google_sheet_data(SHEET_URL) == ""
+
+    # Within the failure window the error is reused, not re-fetched
+    clock[0] += sheets._SHEET_FAILURE_TTL_SECONDS - 1
+    assert await sheets.fetch_google_sheet_data(SHEET_URL) == ""
+    assert http_client.get.await_count == 1
+
+    # Once it lapses the download is retried
+    clock[0] += 2
+    result = await sheets.fetch_google_sheet_data(SHEET_URL)
+    assert http_client.get.await_count == 2
+    assert "* Gadget (G2): $20" in result
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_download(http_client):
+    release = asyncio.Event()
+
+    async def slow_get(*args, **kwargs):
+        await release.wait()
+        return _response(200, CSV_BODY)
+
+    http_client.get.side_effect = slow_get
+
+    sheets.prefetch_google_sheet(SHEET_URL)
+    callers = [
+        asyncio.create_task(sheets.fetch_google_sheet_data(SHEET_URL, query)) for query in ("widget", "gadget", None)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    widget, gadget, everything = await asyncio.gather(*callers)
+
+    assert http_client.get.await_count == 1
+    assert "Widget" in widget and "Gadget" not in widget
+    assert "Gadget" in gadget and "Widget" not in gadget
+    assert "Widget" in everything and "Gadget" in everything
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_caller_does_not_cancel_the_shared_download(http_client):
+    release = asyncio.Event()
+
+    async def slow_get(*args, **kwargs):
+        await release.wait()
+        return _response(200, CSV_BODY)
+
+    http_client.get.side_effect = slow_get
+
+    cancelled = asyncio.create_task(sheets.fetch_google_sheet_data(SHEET_URL))
+    survivor = asyncio.create_task(sheets.fetch_google_sheet_data(SHEET_URL))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    release.set()
+    assert "* Widget (W1): $10" in await survivor
+
+    _, download = sheets._sheet_downloads[EXPORT_URL]
+    assert not download.cancelled()
+    assert http_client.get.await_count == 1
@@ -0,0 +1,86 @@
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.agent import summarizer
+from app.dtos.summary import ContactInfo, ConversationSummary
+
+HISTORY = [
+    {"role": "user", "content": "How much is the Widget?", "timestamp": "2026-01-01T10:00:00Z"},
+    {"role": "ai", "content": "The Widget is $10."},
+]
+
+SUMMARY = ConversationSummary(
+    purchase_intent="High",
+    urgency_level="Low",
+    sentiment_score="Positive",
+    detected_language="English",
+    ai_summary="Asked for the Widget price.",
+    contact_info=ContactInfo(),
+    client_description="Price shopper",
+)
+
+
+@pytest.fixture
+def rag_client():
+    client = MagicMock()
+    client.get_history = AsyncMock(return_value=HISTORY)
+    return client
+
+
+@pytest.fixture
+def release():
+    return asyncio.Event()
+
+
+@pytest.fixture
+def mock_invoke_llm(mocker, release):
+    async def slow_invoke(*args, **kwargs):
+        await release.wait()
+        return {"parsed": SUMMARY, "raw": None, "parsing_error": None}
+
+    mocker.patch("app.agent.summarizer._get_summary_chain")
+    return mocker.patch("app.agent.summarizer.invoke_llm", side_effect=slow_invoke)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_summaries_of_one_conversation_share_a_run(rag_client, release, mock_invoke_llm):
+    session_id = uuid.uuid4()
+
+    callers = [asyncio.create_task(summarizer.summarize_start_conversation(session_id, rag_client)) for _ in range(3)]
+    other_language = asyncio.create_task(summarizer.summarize_start_conversation(session_id, rag_client, "Spanish"))
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*callers)
+    await other_language
+
+    # One run for the three identical calls, a separate one for the other language
+    assert mock_invoke_llm.await_count == 2
+    assert rag_client.get_history.await_count == 2
+    assert all(result == results[0] for result in results)
+    assert results[0]["ai_summary"] == "Asked for the Widget price."
+    assert results[0]["session_start_time"] == "2026-01-01T10:00:00Z"
+
+    # Each caller gets its own copy to add keys to
+    results[0]["extra"] = True
+    assert "extra" not in results[1]
+    assert summarizer._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_caller_does_not_cancel_the_shared_summary(rag_client, release, mock_invoke_llm):
+    session_id = uuid.uuid4()
+
+    cancelled = asyncio.create_task(summarizer.summarize_start_conversation(session_id, rag_client))
+    survivor = asyncio.create_task(summarizer.summarize_start_conversation(session_id, rag_client))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    release.set()
+    assert (await survivor)["ai_summary"] == "Asked for the Widget price."
+    assert mock_invoke_llm.await_count == 1
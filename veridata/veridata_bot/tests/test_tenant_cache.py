@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.bot import actions
+
+CONFIG = {"rag": {"tenant_id": "t1"}, "chatwoot": {"account_id": 1}}
+
+
+@pytest.fixture(autouse=True)
+def reset_tenant_cache():
+    actions._tenant_cache.clear()
+    yield
+    actions._tenant_cache.clear()
+
+
+@pytest.fixture
+def db():
+    result = MagicMock()
+    result.first.return_value = SimpleNamespace(id=7, slug="acme", config=CONFIG)
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_caches_plain_values_not_the_mapped_client(db):
+    tenant, configs = await actions.get_client_and_config("acme", db)
+    cached_tenant, cached_configs = await actions.get_client_and_config("acme", db)
+
+    assert db.execute.await_count == 1
+    assert tenant == cached_tenant == actions.Tenant(id=7, slug="acme")
+    assert cached_configs == CONFIG
+
+
+@pytest.mark.asyncio
+async def test_each_caller_gets_its_own_config_dict(db):
+    _, configs = await actions.get_client_and_config("acme", db)
+    configs["hubspot"] = {"access_token": "x"}
+
+    _, other = await actions.get_client_and_config("acme", db)
+    assert "hubspot" not in other
@@ -1,16 +1,44 @@
 import logging
+from collections import OrderedDict
+
 from src.services.llm_factory import get_llm
 
 logger = logging.getLogger(__name__)
 
 from src.utils.prompts import HYDE_PROMPT_TEMPLATE
 
+# (normalized query, provider, model_name) -> hypothetical answer for the first phrasing seen
+_hyde_cache: OrderedDict[tuple, str] = OrderedDict()
+_HYDE_CACHE_MAX = 4096
+
+
+def _normalize_query(query: str) -> str:
+    # Cache key only: "Hello?" / "hello" / " HELLO " share one entry. Inner punctuation is
+    # kept so "$49.90" / "$4990" or "C++" / "C" do not collide.
+    return " ".join(query.lower().split()).rstrip("?!. ")
+
+
+def _hypothetical_for(query: str, provider: str = None, model_name: str = None) -> str:
+    key = (_normalize_query(query), provider, model_name)
+    cached = _hyde_cache.get(key)
+    if cached is not None:
+        _hyde_cache.move_to_end(key)
+        return cached
+
+    # The LLM sees the user's original wording; failures raise and are therefore never cached
+    llm = get_llm(step="rag_search", provider=provider, model_name=model_name)
+    response = llm.complete(HYDE_PROMPT_TEMPLATE.format(query=query))
+    hypothetical = response.text.strip()
+
+    _hyde_cache[key] = hypothetical
+    if len(_hyde_cache) > _HYDE_CACHE_MAX:
+        _hyde_cache.popitem(last=False)
+    return hypothetical
+
 
 def generate_hypothetical_answer(query: str, provider: str = None, model_name: str = None) -> str:
     try:
-        llm = get_llm(step="rag_search", provider=provider, model_name=model_name)
-        response = llm.complete(HYDE_PROMPT_TEMPLATE.format(query=query))
-        hypothetical = response.text.strip()
+        hypothetical = _hypothetical_for(query, provider, model_name)
         logger.info(f"HyDE generated (rag_search): {hypothetical[:100]}...")
         return hypothetical
     except Exception as e:
@@ -10,7 +10,9 @@ logger = logging.getLogger(__name__)
 _llm_instances = {}
 
 
-def get_llm(step: str = "generation", provider: str = None, model_name: str = None) -> Any:
+def get_llm(
+    step: str = "generation", provider: str = None, model_name: str = None, max_tokens: int = None
+) -> Any:
     settings = {}
     if provider:
         settings = {"provider": provider.lower(), "model": None}
@@ -23,7 +25,7 @@ def get_llm(step: str = "generation", provider: str = None, model_name: str = No
     configured_model = settings.get("model")
     final_model_name = model_name or configured_model
 
-    instance_key = f"{provider}:{final_model_name}"
+    instance_key = f"{provider}:{final_model_name}:{max_tokens}"
 
     if instance_key in _llm_instances:
         return _llm_instances[instance_key]
@@ -39,12 +41,19 @@ def get_llm(step: str = "generation", provider: str = None, model_name: str = No
         if not api_key:
             raise ValueError("GOOGLE_API_KEY not set.")
         final_model_name = final_model_name or os.getenv("GEMINI_MODEL", "models/gemini-2.0-flash")
-        llm = Gemini(model=final_model_name, api_key=api_key)
+        # Gemini's max_tokens argument only feeds metadata; the cap itself must go in generation_config
+        generation_config = {"max_output_tokens": max_tokens} if max_tokens else None
+        llm = Gemini(
+            model=final_model_name,
+            api_key=api_key,
+            max_tokens=max_tokens,
+            generation_config=generation_config,
+        )
 
     else:
         # Should be unreachable due to 'or True' above, but good for safety
         logger.warning(f"Unknown provider '{provider}'. Defaulting to Gemini.")
-        return get_llm(step=step, provider="gemini")
+        return get_llm(step=step, provider="gemini", max_tokens=max_tokens)
 
     _llm_instances[instance_key] = llm
     return llm
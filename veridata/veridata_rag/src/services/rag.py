@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Optional
 from uuid import UUID
@@ -14,7 +15,7 @@ from src.services.rag_flow import (
     prepare_query_context,
     determine_intent,
     retrieve_context,
-    generate_llm_response,
+    format_history,
     generate_llm_response,
     save_interaction,
 )
@@ -98,8 +99,8 @@ async def ingest_document(
 # GENERATION ORCHESTRATOR
 # The "Main Loop" of RAG.
 # 1. Setup: Load tenant preferences (Language).
-# 2. Contextualize: Rewrite user query based on chat history.
-# 3. Intent: Decide Complexity (Small Talk vs RAG) & Routing (Fast vs Reasoner Model).
+# 2. Intent: Decide Complexity (Small Talk vs RAG) & Routing (Fast vs Reasoner Model).
+# 3. Contextualize: Rewrite user query based on chat history (RAG path only).
 # 4. Retrieve: Search Vectors + Hybrid Search + Rerank.
 # 5. Generate: Feed Context + Query to LLM.
 # 6. Save: Persist the conversation.
@@ -117,8 +118,10 @@ async def generate_answer(
 ) -> tuple[str, str]:
     log_start(logger, f"Generating answer for query: '{query}'")
 
-    # 0. Load Dynamic Config (DB Override)
-    config = await get_rag_global_config()
+    # 0. Load Dynamic Config (DB Override) and tenant languages: independent lookups, run together
+    config, lang_instruction = await asyncio.gather(
+        get_rag_global_config(), get_language_instruction(tenant_id)
+    )
     db_model_name = config.get("model_name")
 
     # Resolving flags: DB > Request > Default
@@ -132,18 +135,15 @@ async def generate_answer(
 
     # 1. Config Resolving (Fallback to env/default)
     use_hyde, use_rerank = resolve_config(use_hyde, use_rerank)
-    lang_instruction = await get_language_instruction(tenant_id)
-
-    # 2. Contextualization
-    search_query, history = await prepare_query_context(session_id, query, provider, model_name=db_model_name)
-    history_str = (
-        "\n".join([f"{msg['role'].upper()}: {msg['content']}" for msg in history])
-        if history
-        else ""
-    )
 
-    # 3. Intent & Routing
-    requires_rag, gen_step = determine_intent(complexity_score, pricing_intent)
+    # 2. Intent & Routing (decided from request flags, before any LLM call)
+    requires_rag, gen_step = determine_intent(complexity_score, pricing_intent, query)
+
+    # 3. Contextualization (skipped for small talk: one LLM call instead of two)
+    search_query, history = await prepare_query_context(
+        session_id, query, provider, model_name=db_model_name, contextualize=requires_rag
+    )
+    history_str = format_history(history)
 
     # 4. Execution Flow
     answer = ""
@@ -1,5 +1,7 @@
 import os
 import logging
+import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from uuid import UUID
 
@@ -36,28 +38,47 @@ def get_embed_model():
     return _embed_model
 
 
+@lru_cache(maxsize=2048)
+def _embed_query(text: str) -> tuple[float, ...]:
+    # Repeated queries (greetings, FAQ phrasings, HyDE hits) skip the embedding API call.
+    # Stored as a tuple so the cached vector cannot be mutated by a caller.
+    return tuple(get_embed_model().get_query_embedding(text))
+
+
 # ==================================================================================
 # FLOW HELPER: CONTEXTUALIZE
 # Rewrites the user query to include context from previous messages.
 # Example: "How much is it?" -> "How much is the Standard Plan?"
 # ==================================================================================
+def format_history(history: List[Dict[str, str]]) -> str:
+    """Renders chat history as 'ROLE: content' lines for the prompts."""
+    return "\n".join(f"{msg['role'].upper()}: {msg['content']}" for msg in history)
+
+
+@lru_cache(maxsize=2048)
+def _contextualized_for(
+    query: str, history_str: str, provider: str = None, model_name: str = None
+) -> str:
+    # Same query after the same recent turns gets the same rewrite; failures raise and are never cached.
+    # The rewrite is a single standalone question, hence the small output cap.
+    llm = get_llm(
+        step="contextualization", provider=provider, model_name=model_name, max_tokens=128
+    )
+    prompt = CONTEXTUALIZE_PROMPT_TEMPLATE.format(history_str=history_str, query=query)
+    response = llm.complete(prompt)
+    return response.text.strip()
+
+
 def contextualize_query(
     query: str, history: List[Dict[str, str]], provider: str = None, model_name: str = None
 ) -> str:
     if not history:
         return query
 
-    history_str = "\n".join(
-        [f"{msg['role'].upper()}: {msg['content']}" for msg in history]
-    )
+    history_str = format_history(history)
 
     try:
-        llm = get_llm(step="contextualization", provider=provider, model_name=model_name)
-        prompt = CONTEXTUALIZE_PROMPT_TEMPLATE.format(
-            history_str=history_str, query=query
-        )
-        response = llm.complete(prompt)
-        rewritten = response.text.strip()
+        rewritten = _contextualized_for(query, history_str, provider, model_name)
         logger.info(f"Contextualized query: '{query}' -> '{rewritten}'")
         return rewritten
     except Exception as e:
@@ -87,9 +108,8 @@ async def search_documents(
         search_query = generate_hypothetical_answer(query, provider=provider, model_name=model_name)
 
     # 2. Embed Query
-    embed_model = get_embed_model()
     try:
-        query_embedding = embed_model.get_query_embedding(search_query)
+        query_embedding = list(_embed_query(search_query))
     except Exception as e:
         logger.error(f"Query embedding failed: {e}")
         return []
@@ -107,7 +127,11 @@ async def search_documents(
     )
 
     # 4. Reranking
-    if use_rerank and results:
+    # With no more candidates than we return, reranking cannot change the selection,
+    # only the order within it; keep the RRF order and skip the LLM call.
+    if use_rerank and len(results) <= limit:
+        logger.info(f"Skipping rerank: {len(results)} candidates <= limit {limit}")
+    elif use_rerank and results:
         logger.info(f"Reranking results with {provider}")
         # We rerank against the ORIGINAL query, not the HyDE query
         results = rerank_documents(query, results, top_k=limit, provider=provider, model_name=model_name)
@@ -138,13 +162,18 @@ async def get_language_instruction(tenant_id: UUID) -> str:
 
 
 async def prepare_query_context(
-    session_id: Optional[UUID], query: str, provider: Optional[str], model_name: Optional[str] = None
+    session_id: Optional[UUID],
+    query: str,
+    provider: Optional[str],
+    model_name: Optional[str] = None,
+    contextualize: bool = True,
 ) -> tuple[str, List[Dict]]:
     search_query = query
     history = []
     if session_id:
         history = await get_chat_history(session_id, limit=5)
-        if history:
+        # The standalone rewrite only matters for retrieval; small talk sees the history directly
+        if history and contextualize:
             search_query = contextualize_query(query, history, provider)
     return search_query, history
 
@@ -154,10 +183,23 @@ async def prepare_query_context(
 # Decides if we need RAG (Knowledge) or just Small Talk.
 # Also routes complex queries (>7) to stronger models.
 # ==================================================================================
-def determine_intent(complexity_score: int, pricing_intent: bool) -> tuple[bool, str]:
+# Bare greetings / thanks never need retrieval, whatever complexity the caller sent
+_GREETING_RE = re.compile(
+    r"^\s*(hi|hello|hey|thanks|thank you|obrigad[oa]|oi|ol[aá]|hola|gracias|bom dia|boa tarde|boa noite)\b[\s!.,?]*$",
+    re.I,
+)
+
+
+def determine_intent(
+    complexity_score: int, pricing_intent: bool, query: str = ""
+) -> tuple[bool, str]:
     # Returns (requires_rag, gen_step)
     complexity = 5 if complexity_score is None else complexity_score
 
+    if not pricing_intent and len(query) < 40 and _GREETING_RE.match(query):
+        logger.info("⚡ Opt 3 (Routing): Greeting matched locally. Skipping RAG.")
+        complexity = 1
+
     requires_rag = True
     if complexity < 2 and not pricing_intent:
         requires_rag = False
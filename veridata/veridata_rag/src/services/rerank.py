@@ -1,5 +1,6 @@
 import logging
 import json
+from functools import lru_cache
 from typing import List, Dict, Any
 from src.services.llm_factory import get_llm
 
@@ -7,6 +8,35 @@ logger = logging.getLogger(__name__)
 
 from src.utils.prompts import RERANK_PROMPT_TEMPLATE
 
+# The reply is a bare array of small integers; this leaves ample room for the
+# candidate counts hybrid search returns while stopping runaway explanations.
+RERANK_MAX_TOKENS = 256
+
+_JSON_RESPONSE = {"response_mime_type": "application/json"}
+
+
+# Keys hold the candidate texts (up to ~1KB each), so keep the table modest
+@lru_cache(maxsize=512)
+def _scores_for(
+    query: str, documents_block: str, count: int, provider: str = None, model_name: str = None
+) -> tuple:
+    # Scores depend only on the query and candidate texts; failures raise and are never cached
+    llm = get_llm(
+        step="rag_search",
+        provider=provider,
+        model_name=model_name,
+        max_tokens=RERANK_MAX_TOKENS,
+    )
+    prompt = RERANK_PROMPT_TEMPLATE.format(
+        query=query, documents=documents_block, count=count
+    )
+    # JSON response mode: Gemini returns a bare array, no markdown fences
+    response = llm.complete(prompt, generation_config=_JSON_RESPONSE)
+    scores = json.loads(response.text)
+    if not isinstance(scores, list):
+        raise ValueError(f"Expected a JSON array, got {type(scores).__name__}")
+    return tuple(scores)
+
 
 def rerank_documents(
     query: str,
@@ -21,26 +51,28 @@ def rerank_documents(
     logger.info(
         f"Reranking {len(documents)} documents for query: {query} using step 'rag_search'"
     )
-    llm = get_llm(step="rag_search", provider=provider, model_name=model_name)
-    scored_docs = []
-
-    for doc in documents:
-        try:
-            content_preview = doc["content"][:1000]
-            prompt = RERANK_PROMPT_TEMPLATE.format(query=query, content=content_preview)
-
-            response = llm.complete(prompt)
-            text = response.text.replace("```json", "").replace("```", "").strip()
-            score_data = json.loads(text)
-            score = score_data.get("score", 0)
+    # One prompt for all candidates instead of one LLM round-trip per document
+    documents_block = "\n".join(
+        f"[{i}] {doc['content'][:1000]}" for i, doc in enumerate(documents)
+    )
 
-            doc["rerank_score"] = score
-            scored_docs.append(doc)
+    scores = ()
+    try:
+        scores = _scores_for(query, documents_block, len(documents), provider, model_name)
+        if len(scores) != len(documents):
+            logger.warning(
+                f"Reranker returned {len(scores)} scores for {len(documents)} documents"
+            )
+    except Exception as e:
+        logger.warning(f"Reranking failed, keeping retrieval order: {e}")
+        scores = ()
 
-        except Exception as e:
-            logger.warning(f"Reranking failed for doc {doc.get('id')}: {e}")
+    for i, doc in enumerate(documents):
+        try:
+            doc["rerank_score"] = int(scores[i]) if i < len(scores) else 0
+        except (TypeError, ValueError):
             doc["rerank_score"] = 0
-            scored_docs.append(doc)
 
-    scored_docs.sort(key=lambda x: x["rerank_score"], reverse=True)
+    # Stable sort: unscored documents keep their hybrid-search order
+    scored_docs = sorted(documents, key=lambda x: x["rerank_score"], reverse=True)
     return scored_docs[:top_k]
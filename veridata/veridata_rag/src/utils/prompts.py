@@ -19,17 +19,20 @@ CONTEXTUALIZE_PROMPT_TEMPLATE = (
 )
 
 # 2. RERANK PROMPT
-# Goal: Score relevance.
+# Goal: Score relevance of every candidate in a single call.
 # Logic: Scores "Pricing/Stock" documents higher (10) to ensure Google Sheets data is prioritized.
 RERANK_PROMPT_TEMPLATE = (
-    "You are a relevance ranking system. Analyze if the document provides value for answering the query.\n"
-    "Query: {query}\n"
-    "Document: {content}\n\n"
+    "You are a relevance ranking system. Analyze if each document provides value for answering the query.\n"
+    "Query: {query}\n\n"
+    "<documents>\n"
+    "{documents}\n"
+    "</documents>\n\n"
     "Task:\n"
-    "1. Assign a relevance score from 0 (irrelevant) to 10 (highly relevant).\n"
-    "2. Return ONLY a JSON object. No markdown.\n"
-    "3. SCORING RULE: If the document contains PRICING, STOCK LEVEL, or SKU data (likely from a Spreadsheet), score it 10.\n\n"
-    "JSON Structure: {{ \"score\": integer }}\n"
+    "1. Assign each document a relevance score from 0 (irrelevant) to 10 (highly relevant).\n"
+    "2. Return ONLY a JSON array with one integer per document, in the same order ({count} items). No markdown.\n"
+    "3. SCORING RULE: If a document contains PRICING, STOCK LEVEL, or SKU data (likely from a Spreadsheet), "
+    "score it 10.\n\n"
+    "JSON Structure: [integer, integer, ...]\n"
 )
 
 # 3. HYDE PROMPT (Hypothetical Document Embeddings)
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services import hyde
+
+
+@pytest.fixture(autouse=True)
+def clear_hyde_cache():
+    hyde._hyde_cache.clear()
+    yield
+    hyde._hyde_cache.clear()
+
+
+@pytest.fixture
+def llm(mocker):
+    llm = MagicMock()
+    llm.complete.return_value = SimpleNamespace(text=" The Pro plan costs $49.90 per month. ")
+    mocker.patch("src.services.hyde.get_llm", return_value=llm)
+    return llm
+
+
+def test_prompts_with_the_original_query(llm):
+    answer = hyde.generate_hypothetical_answer("Does the $49.90 plan include C++ e-mail support?")
+
+    assert answer == "The Pro plan costs $49.90 per month."
+    assert "Does the $49.90 plan include C++ e-mail support?" in llm.complete.call_args.args[0]
+
+
+def test_rephrasings_share_one_cache_entry(llm):
+    hyde.generate_hypothetical_answer("How much is the Pro plan?")
+    hyde.generate_hypothetical_answer("  how much is the pro plan ")
+
+    assert llm.complete.call_count == 1
+
+
+def test_inner_punctuation_keeps_queries_apart(llm):
+    hyde.generate_hypothetical_answer("Is it $49.90?")
+    hyde.generate_hypothetical_answer("Is it $4990?")
+    hyde.generate_hypothetical_answer("Do you teach C++?")
+    hyde.generate_hypothetical_answer("Do you teach C?")
+
+    assert llm.complete.call_count == 4
+
+
+def test_failure_falls_back_to_the_query_and_is_not_cached(llm):
+    llm.complete.side_effect = [RuntimeError("quota"), SimpleNamespace(text="answer")]
+
+    assert hyde.generate_hypothetical_answer("pricing?") == "pricing?"
+    assert hyde.generate_hypothetical_answer("pricing?") == "answer"
@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services import rerank
+
+
+def _documents(count: int) -> list[dict]:
+    return [{"content": f"document {i}"} for i in range(count)]
+
+
+@pytest.fixture(autouse=True)
+def clear_score_cache():
+    rerank._scores_for.cache_clear()
+    yield
+    rerank._scores_for.cache_clear()
+
+
+@pytest.fixture
+def llm(mocker):
+    llm = MagicMock()
+    mocker.patch("src.services.rerank.get_llm", return_value=llm)
+    return llm
+
+
+def _reply(llm, text: str) -> None:
+    llm.complete.return_value = SimpleNamespace(text=text)
+
+
+def test_orders_documents_by_score_in_one_call(llm):
+    _reply(llm, "[2, 9, 5]")
+
+    ranked = rerank.rerank_documents("price?", _documents(3), top_k=2)
+
+    assert [doc["content"] for doc in ranked] == ["document 1", "document 2"]
+    assert llm.complete.call_count == 1
+
+
+def test_short_score_array_scores_missing_documents_zero(llm):
+    _reply(llm, "[3, 7]")
+
+    ranked = rerank.rerank_documents("price?", _documents(4))
+
+    assert [doc["content"] for doc in ranked] == ["document 1", "document 0", "document 2", "document 3"]
+    assert [doc["rerank_score"] for doc in ranked] == [7, 3, 0, 0]
+
+
+def test_invalid_scores_count_as_zero(llm):
+    _reply(llm, '[null, "high", 4, "6"]')
+
+    ranked = rerank.rerank_documents("price?", _documents(4))
+
+    assert [doc["content"] for doc in ranked] == ["document 3", "document 2", "document 0", "document 1"]
+    assert [doc["rerank_score"] for doc in ranked] == [6, 4, 0, 0]
+
+
+@pytest.mark.parametrize("reply", ['{"scores": [1, 2]}', "not json"])
+def test_unusable_reply_keeps_retrieval_order_and_is_not_cached(llm, reply):
+    _reply(llm, reply)
+
+    ranked = rerank.rerank_documents("price?", _documents(3))
+    assert [doc["content"] for doc in ranked] == ["document 0", "document 1", "document 2"]
+    assert all(doc["rerank_score"] == 0 for doc in ranked)
+
+    _reply(llm, "[1, 2, 3]")
+    ranked = rerank.rerank_documents("price?", _documents(3))
+    assert [doc["content"] for doc in ranked] == ["document 2", "document 1", "document 0"]
+    assert llm.complete.call_count == 2